@@ -1,3 +1,24 @@
+from typing import Callable
+
 from fastmcp import FastMCP
+from fastmcp.resources import TextResource
 
 mcp = FastMCP("Google Ads Tools")
+
+
+def static_resource(uri: str, mime_type: str = "text/plain") -> Callable:
+    """Register a parameter-free resource whose text is computed once at import.
+
+    The decorated function runs a single time; every read returns the stored
+    text without calling back into it.
+    """
+    def decorator(fn: Callable[[], str]) -> Callable[[], str]:
+        mcp.add_resource(TextResource(
+            uri=uri,
+            name=fn.__name__,
+            description=fn.__doc__,
+            mime_type=mime_type,
+            text=fn(),
+        ))
+        return fn
+    return decorator
@@ -3,18 +3,33 @@ Google Ads OAuth Authentication - cohnen's approach integrated into tool calls
 """
 
 import os
+import re
 import json
 import time
+import random
+import functools
 import requests
 import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 
-# Google Auth libraries
-from google_auth_oauthlib.flow import InstalledAppFlow
+# Google Auth libraries (google_auth_oauthlib is imported lazily in
+# get_oauth_credentials; it is only needed for the first-run consent flow)
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
 
+# orjson is optional; it parses and serializes large API payloads several
+# times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -32,15 +47,70 @@ API_VERSION = "v23"
 GOOGLE_ADS_OAUTH_CONFIG_PATH = os.environ.get("GOOGLE_ADS_OAUTH_CONFIG_PATH")
 GOOGLE_ADS_DEVELOPER_TOKEN = os.environ.get("GOOGLE_ADS_DEVELOPER_TOKEN")
 
+# Shared keep-alive connection pool for all Google Ads / OAuth HTTP calls, so
+# each tool call reuses an open TLS connection instead of handshaking anew.
+# Retries are handled by _make_request, not by the adapter.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+# In-process OAuth state: the loaded credentials, and the headers built for
+# the current access token, as (token, {manager_id: headers}). Everything is
+# rebuilt only when the token rotates. The headers dicts are shared between
+# concurrent tool calls; never mutate them.
+_credentials = None
+_credentials_lock = threading.Lock()
+_headers_cache = (None, {})
+
+# Refresh the access token this long before it expires so a request never
+# goes out with a token that lapses in flight
+_TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+_NON_DIGITS = re.compile(r'[^0-9]')
+
+@functools.lru_cache(maxsize=4096)
 def format_customer_id(customer_id: str) -> str:
     """Format customer ID to ensure it's 10 digits without dashes."""
-    customer_id = str(customer_id)
-    customer_id = customer_id.replace('\"', '').replace('"', '')
-    customer_id = ''.join(char for char in customer_id if char.isdigit())
-    return customer_id.zfill(10)
+    return _NON_DIGITS.sub('', str(customer_id)).zfill(10)
+
+def _credentials_usable(creds) -> bool:
+    """True if creds are valid and not within _TOKEN_EXPIRY_MARGIN of expiring."""
+    if creds is None or not creds.valid:
+        return False
+    if creds.expiry is None:
+        return True
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - now > _TOKEN_EXPIRY_MARGIN
 
 def get_oauth_credentials():
     """Get and refresh OAuth user credentials using cohnen's approach."""
+    global _credentials
+    if _credentials_usable(_credentials):
+        return _credentials
+
+    # Only one thread loads/refreshes; concurrent tool calls wait for it
+    # instead of each hitting the token endpoint
+    with _credentials_lock:
+        if not _credentials_usable(_credentials):
+            _credentials = _load_credentials(_credentials)
+        return _credentials
+
+def _refresh_rejected_token(stale_token: str) -> str:
+    """Force a refresh after the API rejected stale_token; return the new token.
+
+    Covers tokens revoked or rotated before their recorded expiry. Concurrent
+    callers holding the same stale token share a single refresh.
+    """
+    global _credentials
+    with _credentials_lock:
+        if _credentials is not None and _credentials.token == stale_token:
+            # A credential without a token is never valid, so this refreshes
+            _credentials.token = None
+            _credentials = _load_credentials(_credentials)
+        return _credentials.token
+
+def _load_credentials(creds=None):
+    """Refresh creds, or load them from the token file, or run the OAuth flow."""
     if not GOOGLE_ADS_OAUTH_CONFIG_PATH:
         raise ValueError(
             "GOOGLE_ADS_OAUTH_CONFIG_PATH environment variable not set. "
@@ -50,14 +120,12 @@ def get_oauth_credentials():
     if not os.path.exists(GOOGLE_ADS_OAUTH_CONFIG_PATH):
         raise FileNotFoundError(f"OAuth config file not found: {GOOGLE_ADS_OAUTH_CONFIG_PATH}")
     
-    creds = None
-    
     # Path to store the token (same directory as OAuth config)
     config_dir = os.path.dirname(os.path.abspath(GOOGLE_ADS_OAUTH_CONFIG_PATH))
     token_path = os.path.join(config_dir, 'google_ads_token.json')
     
-    # Load existing token if it exists
-    if os.path.exists(token_path):
+    # Load existing token if it exists (and nothing is held in memory yet)
+    if creds is None and os.path.exists(token_path):
         try:
             logger.info(f"Loading existing OAuth token from {token_path}")
             creds = Credentials.from_authorized_user_file(token_path, SCOPES)
@@ -66,11 +134,11 @@ def get_oauth_credentials():
             creds = None
     
     # Check if credentials are valid
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+    if not _credentials_usable(creds):
+        if creds and creds.refresh_token:
             try:
                 logger.info("Refreshing expired OAuth token")
-                creds.refresh(Request())
+                creds.refresh(Request(session=_session))
                 logger.info("Token successfully refreshed")
             except RefreshError as e:
                 logger.warning(f"Token refresh failed: {e}, will get new token")
@@ -84,6 +152,8 @@ def get_oauth_credentials():
             logger.info("Starting OAuth authentication flow")
             
             try:
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 # Load client configuration
                 with open(GOOGLE_ADS_OAUTH_CONFIG_PATH, 'r') as f:
                     client_config = json.load(f)
@@ -117,42 +187,204 @@ def get_oauth_credentials():
     
     return creds
 
+def _json_loads(resp) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+# Error bodies are echoed back to the model; cap them so a large failure
+# response doesn't flood the tool result
+_MAX_ERROR_BODY = 2048
+
+def _error_body(resp) -> str:
+    """Response body text for error messages, truncated to _MAX_ERROR_BODY chars."""
+    text = resp.text
+    if len(text) > _MAX_ERROR_BODY:
+        return text[:_MAX_ERROR_BODY] + f"... [{len(text) - _MAX_ERROR_BODY} more chars]"
+    return text
+
+# Transient statuses retried by _make_request: rate limiting plus the 5xx
+# errors the Google Ads API and its front ends return under load
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# (connect, read) timeout for API calls; large GAQL pages and keyword
+# planner responses can take tens of seconds to produce
+_DEFAULT_TIMEOUT = (5, 120)
+
+# Longest Retry-After _make_request will sleep for inside a tool call; a
+# server asking for more gets its response returned as the error instead
+_MAX_RETRY_AFTER = 60.0
+
+class _AdaptiveLimit:
+    """AIMD cap on Google Ads requests in flight across all tool calls.
+
+    The limit grows by about one per window of successful requests and halves
+    when Google Ads pushes back (429), so it settles near the account's quota
+    instead of relying on a hand-tuned constant.
+    """
+
+    def __init__(self, initial=4.0, minimum=1.0, maximum=16.0):
+        self._limit = initial
+        self._min = minimum
+        self._max = maximum
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, overloaded):
+        with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                self._limit = max(self._min, self._limit / 2)
+            else:
+                self._limit = min(self._max, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+# Held only for the request itself, never during a retry sleep
+_request_limit = _AdaptiveLimit()
+
+
+def _retry_after_seconds(resp):
+    """Seconds requested by a Retry-After header (delta or HTTP date), or None."""
+    value = resp.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
 def _make_request(method, url, headers, json_body=None, max_retries=3):
-    """HTTP request with exponential backoff on transient errors (429, 500, 503)."""
-    for attempt in range(max_retries + 1):
-        resp = method(url, headers=headers, json=json_body) if json_body is not None else method(url, headers=headers)
-        if resp.status_code in (429, 500, 503) and attempt < max_retries:
-            wait = 2 ** attempt
-            logger.warning(f"HTTP {resp.status_code} on attempt {attempt + 1}/{max_retries}, retrying in {wait}s...")
+    """HTTP request with jittered exponential backoff on transient errors (429, 5xx).
+
+    A Retry-After header on the response takes precedence over the computed
+    backoff when it asks for a longer wait; one longer than _MAX_RETRY_AFTER
+    is not waited out and the response is returned as is. A 401 refreshes
+    the access token and resends once with the new one.
+    """
+    if json_body is None:
+        body = {}
+    elif orjson is not None:
+        # Serialize once up front; retries resend the same bytes
+        body = {'data': orjson.dumps(json_body)}
+    else:
+        body = {'json': json_body}
+    attempt = 0
+    reauthorized = False
+    while True:
+        _request_limit.acquire()
+        resp = None
+        try:
+            resp = method(url, headers=headers, timeout=_DEFAULT_TIMEOUT, **body)
+        finally:
+            _request_limit.release(resp is not None and resp.status_code == 429)
+        if resp.status_code == 401 and not reauthorized and 'Authorization' in headers:
+            reauthorized = True
+            stale_token = headers['Authorization'].split(' ', 1)[-1]
+            logger.warning("HTTP 401, refreshing the access token and retrying...")
+            headers = {**headers, 'Authorization': f'Bearer {_refresh_rejected_token(stale_token)}'}
+            continue
+        if resp.status_code in _RETRY_STATUSES and attempt < max_retries:
+            # Jitter keeps concurrent tool calls that were throttled together
+            # from retrying in lockstep
+            wait = 2 ** attempt + random.uniform(0, 1)
+            retry_after = _retry_after_seconds(resp)
+            if retry_after is not None:
+                if retry_after > _MAX_RETRY_AFTER:
+                    logger.warning(f"HTTP {resp.status_code} with Retry-After {retry_after:.0f}s, not retrying")
+                    return resp
+                wait = max(wait, retry_after)
+            attempt += 1
+            logger.warning(f"HTTP {resp.status_code} on attempt {attempt}/{max_retries}, retrying in {wait:.1f}s...")
             time.sleep(wait)
             continue
         return resp
-    return resp
 
 
-def get_headers_with_auto_token() -> Dict[str, str]:
-    """Get API headers with automatically managed token - integrated OAuth."""
+def get_headers_with_auto_token(customer_id: str = "", manager_id: str = "") -> Dict[str, str]:
+    """Get API headers with automatically managed token - integrated OAuth.
+
+    Returns a shared, read-only headers dict per manager_id (adding
+    login-customer-id when one is given), cached until the access token
+    rotates. customer_id is accepted so call sites can pass (cid, mgr) but
+    does not affect the headers.
+    """
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("GOOGLE_ADS_DEVELOPER_TOKEN environment variable not set")
     
+    global _headers_cache
     # This will automatically trigger OAuth flow if needed
     creds = get_oauth_credentials()
     
-    headers = {
-        'Authorization': f'Bearer {creds.token}',
-        'Developer-Token': GOOGLE_ADS_DEVELOPER_TOKEN.strip('"').strip("'"),
-        'Content-Type': 'application/json'
-    }
-    
+    token, by_manager = _headers_cache
+    if creds.token != token:
+        by_manager = {}
+        _headers_cache = (creds.token, by_manager)
+
+    headers = by_manager.get(manager_id)
+    if headers is None:
+        headers = {
+            'Authorization': f'Bearer {creds.token}',
+            'Developer-Token': GOOGLE_ADS_DEVELOPER_TOKEN.strip('"').strip("'"),
+            'Content-Type': 'application/json'
+        }
+        if manager_id:
+            headers['login-customer-id'] = format_customer_id(manager_id)
+        by_manager[manager_id] = headers
     return headers
 
-def execute_gaql(customer_id: str, query: str, manager_id: str = "") -> Dict[str, Any]:
-    """Execute GAQL with automatic pagination and retry."""
-    headers = get_headers_with_auto_token()
+# Opt-in execute_gaql result cache. Report queries over completed days return
+# the same rows for a while, and an assistant iterating on an analysis tends
+# to repeat them. Only read tools whose ranges exclude today should opt in;
+# lookups that feed a mutate must always see live data.
+_gaql_cache = TTLCache(maxsize=512, ttl=600)
+_gaql_cache_lock = threading.Lock()
+
+# Results are cached serialized, so every hit decodes a fresh copy and no
+# caller can change what the next one gets
+if orjson is not None:
+    _cache_dumps, _cache_loads = orjson.dumps, orjson.loads
+else:
+    _cache_dumps, _cache_loads = json.dumps, json.loads
+
+def execute_gaql(customer_id: str, query: str, manager_id: str = "", cache: bool = False) -> Dict[str, Any]:
+    """Execute GAQL with automatic pagination and retry.
+
+    With cache=True the result is memoized per (customer, manager, query)
+    for 10 minutes; each call gets its own copy.
+    """
     formatted_customer_id = format_customer_id(customer_id)
+    if cache:
+        # The manager (login-customer-id) is part of the key so a call
+        # through a manager without access to the customer is never served
+        # rows fetched through one that has it
+        key = (formatted_customer_id, format_customer_id(manager_id) if manager_id else "", query)
+        with _gaql_cache_lock:
+            cached = _gaql_cache.get(key)
+        if cached is not None:
+            return _cache_loads(cached)
+        result = execute_gaql(formatted_customer_id, query, manager_id)
+        encoded = _cache_dumps(result)
+        with _gaql_cache_lock:
+            _gaql_cache[key] = encoded
+        return result
+
+    headers = get_headers_with_auto_token(customer_id, manager_id)
     url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:search"
-    if manager_id:
-        headers['login-customer-id'] = format_customer_id(manager_id)
 
     all_results = []
     next_page_token = None
@@ -160,10 +392,10 @@ def execute_gaql(customer_id: str, query: str, manager_id: str = "") -> Dict[str
         payload = {'query': query}
         if next_page_token:
             payload['pageToken'] = next_page_token
-        resp = _make_request(requests.post, url, headers, json_body=payload)
+        resp = _make_request(_session.post, url, headers, json_body=payload)
         if not resp.ok:
-            raise Exception(f"Error executing GAQL: {resp.status_code} {resp.reason} - {resp.text}")
-        data = resp.json()
+            raise Exception(f"Error executing GAQL: {resp.status_code} {resp.reason} - {_error_body(resp)}")
+        data = _json_loads(resp)
         all_results.extend(data.get('results', []))
         next_page_token = data.get('nextPageToken')
         if not next_page_token:
@@ -1,22 +1,22 @@
 """Google Ads MCP Server - modular entry point."""
 
+import argparse
+import functools
+import gzip
+import hashlib
+import importlib.util
 import logging
-import sys
+import os
 
+import anyio
 from dotenv import load_dotenv
-load_dotenv()
+from starlette.requests import Request
+from starlette.responses import Response
 
-from mcp_instance import mcp  # noqa: E402
+from mcp_instance import mcp, static_resource
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger('google_ads_server')
 
-logger.info("Starting Google Ads MCP Server...")
-
 # Import tool modules so their @mcp.tool decorators register on the shared instance
 import tools.accounts    # noqa: F401, E402
 import tools.read        # noqa: F401, E402
@@ -35,129 +35,81 @@ import tools.pmax        # noqa: F401, E402
 import tools.shopping    # noqa: F401, E402
 
 
-@mcp.resource("gaql://reference")
+# Static payload for the gaql://reference resource, read once at import.
+# Kept out of server.py so the text is not embedded in the module's code object.
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "gaql_reference.txt"), "rb") as _f:
+    _GAQL_REFERENCE_BYTES = _f.read().strip()
+_GAQL_REFERENCE = _GAQL_REFERENCE_BYTES.decode("utf-8")
+_GAQL_REFERENCE_GZ = gzip.compress(_GAQL_REFERENCE_BYTES, compresslevel=9, mtime=0)
+# Weak validator: the gzip and identity encodings share it
+_GAQL_REFERENCE_ETAG = f'W/"{hashlib.sha256(_GAQL_REFERENCE_BYTES).hexdigest()[:16]}"'
+
+
+@static_resource("gaql://reference")
 def gaql_reference() -> str:
     """Google Ads Query Language (GAQL) reference documentation."""
-    return """Schema Format:
-                ## Basic Query Structure
-                '''
-                SELECT field1, field2, ...
-                FROM resource_type
-                WHERE condition
-                ORDER BY field [ASC|DESC]
-                LIMIT n
-                '''
-
-                ## Common Field Types
-
-                ### Resource Fields
-                - campaign.id, campaign.name, campaign.status
-                - ad_group.id, ad_group.name, ad_group.status
-                - ad_group_ad.ad.id, ad_group_ad.ad.final_urls
-                - ad_group_criterion.keyword.text, ad_group_criterion.keyword.match_type (for keyword_view)
-
-                ### Metric Fields
-                - metrics.impressions
-                - metrics.clicks
-                - metrics.cost_micros
-                - metrics.conversions
-                - metrics.conversions_value (direct conversion revenue - primary revenue metric)
-                - metrics.ctr
-                - metrics.average_cpc
-
-                ### Segment Fields
-                - segments.date
-                - segments.device
-                - segments.day_of_week
-
-                ## Common WHERE Clauses
-
-                ### Date Ranges
-                - WHERE segments.date DURING LAST_7_DAYS
-                - WHERE segments.date DURING LAST_30_DAYS
-                - WHERE segments.date BETWEEN '2023-01-01' AND '2023-01-31'
-
-                ### Filtering
-                - WHERE campaign.status = 'ENABLED'
-                - WHERE metrics.clicks > 100
-                - WHERE campaign.name LIKE '%Brand%'
-                - Use LIKE '%keyword%' instead of CONTAINS 'keyword' (CONTAINS not supported)
-
-                EXAMPLE QUERIES:
-
-                1. Basic campaign metrics:
-                SELECT
-                campaign.id,
-                campaign.name,
-                metrics.clicks,
-                metrics.impressions,
-                metrics.cost_micros
-                FROM campaign
-                WHERE segments.date DURING LAST_7_DAYS
-
-                2. Ad group performance:
-                SELECT
-                campaign.id,
-                ad_group.name,
-                metrics.conversions,
-                metrics.cost_micros,
-                campaign.name
-                FROM ad_group
-                WHERE metrics.clicks > 100
-
-                3. Keyword analysis (CORRECT field names):
-                SELECT
-                campaign.id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                metrics.average_position,
-                metrics.ctr
-                FROM keyword_view
-                WHERE segments.date DURING LAST_30_DAYS
-                ORDER BY metrics.impressions DESC
-
-                4. Get conversion data with revenue:
-                SELECT
-                campaign.id,
-                campaign.name,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.all_conversions_value,
-                metrics.cost_micros
-                FROM campaign
-                WHERE segments.date DURING LAST_30_DAYS
-
-                IMPORTANT NOTES & COMMON ERRORS TO AVOID:
-
-                ### Field Errors to Avoid:
-                WRONG: campaign.campaign_budget.amount_micros
-                CORRECT: campaign_budget.amount_micros (query from campaign_budget resource)
-
-                WRONG: keyword.text, keyword.match_type
-                CORRECT: ad_group_criterion.keyword.text, ad_group_criterion.keyword.match_type
-
-                ### Required Fields:
-                - Always include campaign.id when querying ad_group, keyword_view, or other campaign-related resources
-                - Some resources require specific reference fields in SELECT clause
-
-                ### Revenue Metrics:
-                - metrics.conversions_value = Direct conversion revenue (use for ROI calculations)
-                - metrics.all_conversions_value = Total attributed revenue (includes view-through)
-
-                ### String Matching:
-                - Use LIKE '%keyword%' not CONTAINS 'keyword'
-                - GAQL does not support CONTAINS operator
-
-                NOTE:
-                - Date ranges must be finite: LAST_7_DAYS, LAST_30_DAYS, or BETWEEN dates
-                - Cannot use open-ended ranges like >= '2023-01-31'
-                - Always include campaign.id when error messages request it."""
+    return _GAQL_REFERENCE
+
+
+@mcp.custom_route("/gaql/reference", methods=["GET"])
+async def gaql_reference_http(request: Request) -> Response:
+    """Serve the GAQL reference over HTTP, precompressed when the client accepts gzip.
+
+    Revalidations carrying the current ETag get an empty 304.
+    """
+    headers = {"Vary": "Accept-Encoding", "ETag": _GAQL_REFERENCE_ETAG}
+    if request.headers.get("if-none-match") == _GAQL_REFERENCE_ETAG:
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(_GAQL_REFERENCE_GZ, media_type="text/plain; charset=utf-8", headers=headers)
+    return Response(_GAQL_REFERENCE_BYTES, media_type="text/plain; charset=utf-8", headers=headers)
+
+
+def _configure_logging() -> None:
+    """Install the console handler without going through logging.basicConfig."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Google Ads MCP Server")
+    parser.add_argument("--http", action="store_true",
+                        help="Serve over streamable HTTP instead of STDIO")
+    parser.add_argument("--uds", metavar="PATH",
+                        help="With --http, listen on this Unix domain socket instead of 127.0.0.1:8000")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log transport startup messages")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    if "--http" in sys.argv:
-        logger.info("Starting with HTTP transport on http://127.0.0.1:8000/mcp")
-        mcp.run(transport="streamable-http", host="127.0.0.1", port=8000, path="/mcp")
+    args = _parse_args()
+    # Importing server.py as a library leaves .env loading to oauth.google_auth
+    # and logging configuration to the host application.
+    load_dotenv()
+    _configure_logging()
+    if args.verbose:
+        logger.info("Starting Google Ads MCP Server...")
+
+    # uvloop is optional (not available on Windows); anyio falls back to
+    # the stock asyncio loop when it is missing.
+    backend_options = {"use_uvloop": importlib.util.find_spec("uvloop") is not None}
+
+    if args.http:
+        http_kwargs = {"transport": "streamable-http", "host": "127.0.0.1", "port": 8000, "path": "/mcp"}
+        if args.uds:
+            # Local clients skip the loopback TCP stack; uvicorn ignores host/port when uds is set
+            http_kwargs["uvicorn_config"] = {"uds": args.uds}
+            if args.verbose:
+                logger.info(f"Starting with HTTP transport on unix socket {args.uds} (path /mcp)")
+        elif args.verbose:
+            logger.info("Starting with HTTP transport on http://127.0.0.1:8000/mcp")
+        anyio.run(functools.partial(mcp.run_async, **http_kwargs), backend_options=backend_options)
     else:
-        logger.info("Starting with STDIO transport for Claude Desktop")
-        mcp.run(transport="stdio")
+        if args.verbose:
+            logger.info("Starting with STDIO transport for Claude Desktop")
+        anyio.run(functools.partial(mcp.run_async, transport="stdio"), backend_options=backend_options)
@@ -0,0 +1,90 @@
+import pytest
+
+google_auth = pytest.importorskip("oauth.google_auth")
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _sequence(*responses):
+    calls = []
+
+    def method(url, **kwargs):
+        calls.append(url)
+        return responses[len(calls) - 1]
+
+    return method, calls
+
+
+def test_large_retry_after_returns_response_without_sleeping(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(google_auth.time, "sleep", sleeps.append)
+    throttled = _Response(429, {"Retry-After": "3600"})
+    method, calls = _sequence(throttled, _Response(200))
+
+    resp = google_auth._make_request(method, "https://example.test", {})
+
+    assert resp is throttled
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_far_future_retry_after_date_is_not_waited_out(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(google_auth.time, "sleep", sleeps.append)
+    throttled = _Response(503, {"Retry-After": "Fri, 31 Dec 2100 23:59:59 GMT"})
+    method, calls = _sequence(throttled, _Response(200))
+
+    resp = google_auth._make_request(method, "https://example.test", {})
+
+    assert resp is throttled
+    assert sleeps == []
+
+
+def test_retry_after_within_cap_is_honored(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(google_auth.time, "sleep", sleeps.append)
+    method, calls = _sequence(_Response(429, {"Retry-After": "30"}), _Response(200))
+
+    resp = google_auth._make_request(method, "https://example.test", {})
+
+    assert resp.status_code == 200
+    assert len(calls) == 2
+    assert sleeps == [30.0]
+
+
+class _SearchResponse(_Response):
+    ok = True
+
+    def __init__(self, rows):
+        super().__init__(200)
+        self.rows = rows
+
+    def json(self):
+        return {'results': [dict(r) for r in self.rows]}
+
+
+def test_mutating_a_cached_gaql_result_does_not_change_the_cache(monkeypatch):
+    requests_sent = []
+
+    def make_request(method, url, headers, json_body=None):
+        requests_sent.append(json_body)
+        return _SearchResponse([{'customerClient': {'id': '1'}}])
+
+    monkeypatch.setattr(google_auth, "get_headers_with_auto_token", lambda *args: {})
+    monkeypatch.setattr(google_auth, "_make_request", make_request)
+    monkeypatch.setattr(google_auth, "_json_loads", lambda resp: resp.json())
+    google_auth._gaql_cache.clear()
+
+    first = google_auth.execute_gaql("1", "SELECT customer_client.id FROM customer_client", cache=True)
+    first['results'][0]['customerClient']['id'] = 'changed'
+    first['results'].append({'extra': True})
+    hit = google_auth.execute_gaql("1", "SELECT customer_client.id FROM customer_client", cache=True)
+    hit['results'].clear()
+    again = google_auth.execute_gaql("1", "SELECT customer_client.id FROM customer_client", cache=True)
+
+    assert len(requests_sent) == 1
+    assert again['results'] == [{'customerClient': {'id': '1'}}]
@@ -1,13 +1,12 @@
 """Account-level management tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -96,8 +95,6 @@ def update_account_settings(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}:mutate"
 
@@ -124,9 +121,9 @@ def update_account_settings(
             "updateMask": ",".join(update_mask_fields),
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Account settings updated: {update_mask_fields}")
@@ -1,32 +1,54 @@
-import requests
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 from typing import Any, Dict, List
+from cachetools import TTLCache
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
 
+# Concurrent GAQL lookups issued by list_accounts
+_MAX_CONCURRENT_LOOKUPS = 16
+
+# Account metadata rarely changes; keep lookups for 10 minutes so repeated
+# list_accounts calls don't re-query every account. Only successful lookups
+# are cached. TTLCache is not thread-safe, hence the lock.
+_account_meta = TTLCache(maxsize=4096, ttl=600)
+_sub_accounts = TTLCache(maxsize=1024, ttl=600)
+_cache_lock = threading.Lock()
+
 
 def _get_customer_info(cid: str):
     """Return (name, is_manager) for a customer ID."""
+    with _cache_lock:
+        cached = _account_meta.get(cid)
+    if cached is not None:
+        return cached
     try:
         result = execute_gaql(cid, "SELECT customer.descriptive_name, customer.manager FROM customer")
         rows = result.get('results', [])
         if not rows:
             return "Name not available", False
         c = rows[0].get('customer', {})
-        return c.get('descriptiveName', 'Name not available'), bool(c.get('manager', False))
+        info = c.get('descriptiveName', 'Name not available'), bool(c.get('manager', False))
     except Exception:
         return "Name not available", False
+    with _cache_lock:
+        _account_meta[cid] = info
+    return info
 
 
 def _get_sub_accounts(manager_id: str) -> List[Dict[str, Any]]:
+    with _cache_lock:
+        cached = _sub_accounts.get(manager_id)
+    if cached is not None:
+        return cached
     try:
         query = (
             "SELECT customer_client.id, customer_client.descriptive_name, "
@@ -46,68 +68,83 @@ def _get_sub_accounts(manager_id: str) -> List[Dict[str, Any]]:
                 'parent_id': manager_id,
                 'level': int(client.get('level', 0))
             })
-        return subs
     except Exception:
         return []
+    with _cache_lock:
+        _sub_accounts[manager_id] = subs
+    return subs
 
 
 @mcp.tool
-def list_accounts(ctx: Context = None) -> Dict[str, Any]:
-    """List all accessible accounts including nested sub-accounts."""
+async def list_accounts(refresh: bool = False, ctx: Context = None) -> Dict[str, Any]:
+    """List all accessible accounts including nested sub-accounts.
+
+    Account names and hierarchy are cached for 10 minutes; pass refresh=True
+    to re-fetch them from the API.
+    """
+    if refresh:
+        with _cache_lock:
+            _account_meta.clear()
+            _sub_accounts.clear()
+
     if ctx:
-        ctx.info("Checking credentials and preparing to list accounts...")
+        await ctx.info("Checking credentials and preparing to list accounts...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        # The HTTP helpers are blocking; run them on worker threads so the
+        # event loop keeps serving other MCP requests meanwhile.
+        headers = await asyncio.to_thread(get_headers_with_auto_token)
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers:listAccessibleCustomers"
-        resp = _make_request(requests.get, url, headers)
+        resp = await asyncio.to_thread(_make_request, _session.get, url, headers)
         if not resp.ok:
-            raise Exception(f"Error listing accounts: {resp.status_code} {resp.reason} - {resp.text}")
+            raise Exception(f"Error listing accounts: {resp.status_code} {resp.reason} - {_error_body(resp)}")
 
-        resource_names = resp.json().get('resourceNames', [])
+        resource_names = _json_loads(resp).get('resourceNames', [])
         if not resource_names:
             return {'accounts': [], 'message': 'No accessible accounts found.'}
 
-        top_level_ids = [rn.split('/')[-1] for rn in resource_names]
+        top_level_ids = [format_customer_id(rn.split('/')[-1]) for rn in resource_names]
 
-        # Fetch top-level account info in parallel
         if ctx:
-            ctx.info(f"Found {len(top_level_ids)} top-level accounts. Fetching details in parallel...")
-
-        accounts = []
-        seen = set()
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(_get_customer_info, format_customer_id(cid)): cid for cid in top_level_ids}
-            for future in as_completed(futures):
-                cid = futures[future]
-                fid = format_customer_id(cid)
-                name, is_manager = future.result()
-                accounts.append({
-                    'id': fid, 'name': name,
-                    'access_type': 'direct', 'is_manager': is_manager, 'level': 0
-                })
-                seen.add(fid)
-
-        # Fetch sub-accounts for managers (also in parallel)
-        manager_ids = [a['id'] for a in accounts if a['is_manager']]
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(_get_sub_accounts, mid): mid for mid in manager_ids}
-            for future in as_completed(futures):
-                for sub in future.result():
-                    if sub['id'] not in seen:
-                        accounts.append(sub)
-                        seen.add(sub['id'])
+            await ctx.info(f"Found {len(top_level_ids)} top-level accounts. Fetching details in parallel...")
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOOKUPS)
+
+        async def lookup(fn, cid: str):
+            async with semaphore:
+                return await asyncio.to_thread(fn, cid)
+
+        async def fetch_tree(fid: str):
+            # A manager's sub-account query starts as soon as its own
+            # lookup finishes, independently of the other accounts.
+            name, is_manager = await lookup(_get_customer_info, fid)
+            account = {
+                'id': fid, 'name': name,
+                'access_type': 'direct', 'is_manager': is_manager, 'level': 0
+            }
+            subs = await lookup(_get_sub_accounts, fid) if is_manager else []
+            return account, subs
+
+        trees = await asyncio.gather(*(fetch_tree(fid) for fid in top_level_ids))
+
+        accounts = [account for account, _ in trees]
+        seen = {a['id'] for a in accounts}
+        for _, subs in trees:
+            for sub in subs:
+                if sub['id'] not in seen:
+                    # Copy: the dicts are shared with the _sub_accounts cache
+                    accounts.append(dict(sub))
+                    seen.add(sub['id'])
 
         if ctx:
-            ctx.info(f"Found {len(accounts)} total accounts.")
+            await ctx.info(f"Found {len(accounts)} total accounts.")
 
         return {'accounts': accounts, 'total_accounts': len(accounts)}
 
     except Exception as e:
         if ctx:
-            ctx.error(f"Error listing accounts: {e}")
+            await ctx.error(f"Error listing accounts: {e}")
         raise
@@ -1,13 +1,12 @@
 """Ad creation and management tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -38,8 +37,6 @@ def update_responsive_search_ad(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/adGroupAds:mutate"
 
@@ -78,9 +75,9 @@ def update_responsive_search_ad(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"RSA {ad_id} updated: {update_mask}")
@@ -207,8 +204,6 @@ def create_responsive_display_ad(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/adGroupAds:mutate"
 
@@ -242,11 +237,11 @@ def create_responsive_display_ad(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
 
         if ctx:
@@ -291,8 +286,6 @@ def create_call_only_ad(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/adGroupAds:mutate"
 
@@ -323,11 +316,11 @@ def create_call_only_ad(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
 
         if ctx:
@@ -365,8 +358,6 @@ def apply_recommendation(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/recommendations:apply"
 
@@ -374,9 +365,9 @@ def apply_recommendation(
             "operations": [{"resourceName": recommendation_resource_name}]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Recommendation applied successfully.")
@@ -411,8 +402,6 @@ def dismiss_recommendation(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/recommendations:dismiss"
 
@@ -420,9 +409,9 @@ def dismiss_recommendation(
             "operations": [{"resourceName": recommendation_resource_name}]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Recommendation dismissed.")
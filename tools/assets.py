@@ -1,13 +1,12 @@
 """Ad asset/extension management tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -108,7 +107,7 @@ def create_image_asset(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         # Download the image
-        img_resp = requests.get(image_url, timeout=30)
+        img_resp = _session.get(image_url, timeout=30)
         if not img_resp.ok:
             raise Exception(f"Failed to download image from {image_url}: {img_resp.status_code}")
 
@@ -116,8 +115,6 @@ def create_image_asset(
         image_data = base64.standard_b64encode(img_resp.content).decode("utf-8")
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/assets:mutate"
 
@@ -135,11 +132,11 @@ def create_image_asset(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
 
         if ctx:
@@ -180,8 +177,6 @@ def add_price_extension(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         price_items = []
         for item in items:
@@ -214,11 +209,11 @@ def add_price_extension(
             ]
         }
 
-        resp = _make_request(requests.post, asset_url, headers, asset_body)
+        resp = _make_request(_session.post, asset_url, headers, asset_body)
         if not resp.ok:
-            raise Exception(f"API error creating price asset: {resp.status_code} {resp.text}")
+            raise Exception(f"API error creating price asset: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         asset_resource = results[0].get("resourceName", "") if results else ""
 
         # Link asset to campaign
@@ -235,9 +230,9 @@ def add_price_extension(
             ]
         }
 
-        link_resp = _make_request(requests.post, link_url, headers, link_body)
+        link_resp = _make_request(_session.post, link_url, headers, link_body)
         if not link_resp.ok:
-            raise Exception(f"API error linking price asset: {link_resp.status_code} {link_resp.text}")
+            raise Exception(f"API error linking price asset: {link_resp.status_code} {_error_body(link_resp)}")
 
         if ctx:
             ctx.info(f"Price extension added to campaign {campaign_id}.")
@@ -284,8 +279,6 @@ def add_promotion_extension(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         promotion_asset: Dict[str, Any] = {
             "promotionTarget": promotion_target,
@@ -317,11 +310,11 @@ def add_promotion_extension(
             ]
         }
 
-        resp = _make_request(requests.post, asset_url, headers, asset_body)
+        resp = _make_request(_session.post, asset_url, headers, asset_body)
         if not resp.ok:
-            raise Exception(f"API error creating promotion asset: {resp.status_code} {resp.text}")
+            raise Exception(f"API error creating promotion asset: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         asset_resource = results[0].get("resourceName", "") if results else ""
 
         # Link to campaign
@@ -338,9 +331,9 @@ def add_promotion_extension(
             ]
         }
 
-        link_resp = _make_request(requests.post, link_url, headers, link_body)
+        link_resp = _make_request(_session.post, link_url, headers, link_body)
         if not link_resp.ok:
-            raise Exception(f"API error linking promotion asset: {link_resp.status_code} {link_resp.text}")
+            raise Exception(f"API error linking promotion asset: {link_resp.status_code} {_error_body(link_resp)}")
 
         if ctx:
             ctx.info(f"Promotion extension added to campaign {campaign_id}.")
@@ -378,8 +371,6 @@ def add_image_extension(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaignAssets:mutate"
 
@@ -395,11 +386,11 @@ def add_image_extension(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
 
         if ctx:
@@ -1,13 +1,12 @@
 """Audience & remarketing tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -105,8 +104,6 @@ def create_customer_match_list(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/userLists:mutate"
 
@@ -127,11 +124,11 @@ def create_customer_match_list(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
 
         if ctx:
@@ -171,8 +168,6 @@ def add_topic_targeting(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/adGroupCriteria:mutate"
 
@@ -190,11 +185,11 @@ def add_topic_targeting(
 
         body = {"operations": operations}
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [])
+        results = _json_loads(resp).get("results", [])
 
         if ctx:
             ctx.info(f"Added {len(results)} topic(s).")
@@ -232,8 +227,6 @@ def add_placement_targeting(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/adGroupCriteria:mutate"
 
@@ -249,11 +242,11 @@ def add_placement_targeting(
 
         body = {"operations": operations}
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [])
+        results = _json_loads(resp).get("results", [])
 
         if ctx:
             ctx.info(f"Added {len(results)} placement(s).")
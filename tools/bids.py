@@ -1,13 +1,12 @@
 """Budget and bidding management tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -34,8 +33,6 @@ def move_keywords(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         # First, fetch the keyword details we need to recreate them
         criterion_ids_str = ", ".join(keyword_criterion_ids)
@@ -67,9 +64,9 @@ def move_keywords(
             for crit_id in keyword_criterion_ids
         ]
         remove_body = {"operations": remove_ops}
-        remove_resp = _make_request(requests.post, url, headers, remove_body)
+        remove_resp = _make_request(_session.post, url, headers, remove_body)
         if not remove_resp.ok:
-            raise Exception(f"Error removing keywords: {remove_resp.status_code} {remove_resp.text}")
+            raise Exception(f"Error removing keywords: {remove_resp.status_code} {_error_body(remove_resp)}")
 
         # Create in destination
         create_ops = []
@@ -92,9 +89,9 @@ def move_keywords(
             create_ops.append(create_op)
 
         create_body = {"operations": create_ops}
-        create_resp = _make_request(requests.post, url, headers, create_body)
+        create_resp = _make_request(_session.post, url, headers, create_body)
         if not create_resp.ok:
-            raise Exception(f"Error creating keywords: {create_resp.status_code} {create_resp.text}")
+            raise Exception(f"Error creating keywords: {create_resp.status_code} {_error_body(create_resp)}")
 
         if ctx:
             ctx.info(f"Moved {len(keyword_criterion_ids)} keywords successfully.")
@@ -203,8 +200,6 @@ def create_shared_budget(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaignBudgets:mutate"
 
@@ -221,11 +216,11 @@ def create_shared_budget(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
 
         if ctx:
@@ -264,8 +259,6 @@ def apply_shared_budget(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaigns:mutate"
 
@@ -281,9 +274,9 @@ def apply_shared_budget(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Budget {budget_id} applied to campaign {campaign_id}.")
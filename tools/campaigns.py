@@ -1,13 +1,12 @@
 """Campaign & ad group listing/management tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -406,8 +405,6 @@ def update_ad_group(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/adGroups:mutate"
 
@@ -436,9 +433,9 @@ def update_ad_group(
             "operations": [{"update": update_body, "updateMask": ",".join(update_mask)}]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Ad group {ad_group_id} updated: {update_mask}")
@@ -475,8 +472,6 @@ def set_campaign_end_date(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaigns:mutate"
 
@@ -492,9 +487,9 @@ def set_campaign_end_date(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Campaign {campaign_id} end date set to {end_date}.")
@@ -533,8 +528,6 @@ def update_campaign_network_settings(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaigns:mutate"
 
@@ -566,9 +559,9 @@ def update_campaign_network_settings(
             ]
         }
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
         if ctx:
             ctx.info(f"Network settings updated for campaign {campaign_id}.")
@@ -1,13 +1,12 @@
 """Performance Max campaign tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -36,8 +35,6 @@ def create_pmax_campaign(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         # Step 1: Create budget
         budget_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaignBudgets:mutate"
@@ -54,11 +51,11 @@ def create_pmax_campaign(
             ]
         }
 
-        budget_resp = _make_request(requests.post, budget_url, headers, budget_body)
+        budget_resp = _make_request(_session.post, budget_url, headers, budget_body)
         if not budget_resp.ok:
-            raise Exception(f"Budget creation error: {budget_resp.status_code} {budget_resp.text}")
+            raise Exception(f"Budget creation error: {budget_resp.status_code} {_error_body(budget_resp)}")
 
-        budget_resource = budget_resp.json()["results"][0]["resourceName"]
+        budget_resource = _json_loads(budget_resp)["results"][0]["resourceName"]
 
         # Step 2: Create campaign
         campaign_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaigns:mutate"
@@ -79,11 +76,11 @@ def create_pmax_campaign(
             campaign_body_data["maximizeConversionValue"] = {}
 
         campaign_body = {"operations": [{"create": campaign_body_data}]}
-        campaign_resp = _make_request(requests.post, campaign_url, headers, campaign_body)
+        campaign_resp = _make_request(_session.post, campaign_url, headers, campaign_body)
         if not campaign_resp.ok:
-            raise Exception(f"Campaign creation error: {campaign_resp.status_code} {campaign_resp.text}")
+            raise Exception(f"Campaign creation error: {campaign_resp.status_code} {_error_body(campaign_resp)}")
 
-        campaign_resource = campaign_resp.json()["results"][0]["resourceName"]
+        campaign_resource = _json_loads(campaign_resp)["results"][0]["resourceName"]
         campaign_id = campaign_resource.split("/")[-1]
 
         if ctx:
@@ -143,8 +140,6 @@ def create_pmax_asset_group(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/assetGroups:mutate"
 
@@ -176,11 +171,11 @@ def create_pmax_asset_group(
 
         body = {"operations": [{"create": asset_group}]}
 
-        resp = _make_request(requests.post, url, headers, body)
+        resp = _make_request(_session.post, url, headers, body)
         if not resp.ok:
-            raise Exception(f"API error: {resp.status_code} {resp.text}")
+            raise Exception(f"API error: {resp.status_code} {_error_body(resp)}")
 
-        results = resp.json().get("results", [{}])
+        results = _json_loads(resp).get("results", [{}])
         resource_name = results[0].get("resourceName", "") if results else ""
         asset_group_id = resource_name.split("/")[-1] if resource_name else ""
 
@@ -1,5 +1,10 @@
-import requests
+import asyncio
+import heapq
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 from fastmcp import Context
 from mcp_instance import mcp
@@ -12,6 +17,176 @@ from oauth.google_auth import (
 logger = logging.getLogger(__name__)
 
 
+def _comparison_periods(days: int):
+    """Return (current_start, current_end, prior_start, prior_end) covering the
+    last `days` complete days and the `days` days before them."""
+    one_day = timedelta(days=1)
+    span = timedelta(days=days - 1)
+    current_end = date.today() - one_day
+    current_start = current_end - span
+    prior_end = current_start - one_day
+    return current_start, current_end, prior_end - span, prior_end
+
+
+def _format_quality_score_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one keyword_view row from get_quality_scores."""
+    c = row.get('campaign') or {}
+    ag = row.get('adGroup') or {}
+    agc = row.get('adGroupCriterion') or {}
+    kw = agc.get('keyword') or {}
+    qi = agc.get('qualityInfo') or {}
+    m = row.get('metrics') or {}
+    return {
+        'keyword': kw.get('text', ''),
+        'match_type': kw.get('matchType', ''),
+        'criterion_id': agc.get('criterionId', ''),
+        'quality_score': qi.get('qualityScore'),
+        'expected_ctr': qi.get('searchPredictedCtr', ''),
+        'ad_relevance': qi.get('creativeQualityScore', ''),
+        'landing_page_experience': qi.get('postClickQualityScore', ''),
+        'campaign_id': c.get('id', ''),
+        'campaign_name': c.get('name', ''),
+        'ad_group_id': ag.get('id', ''),
+        'ad_group_name': ag.get('name', ''),
+        'impressions': int(m.get('impressions', 0)),
+        'clicks': int(m.get('clicks', 0)),
+        'cost_dollars': round(int(m.get('costMicros', 0)) / 1_000_000, 2),
+    }
+
+# Fixed GAQL skeletons, whitespace-collapsed once at import; tools fill in
+# only the variable clauses
+_SEARCH_TERMS_QUERY = " ".join("""
+    SELECT
+        search_term_view.search_term,
+        search_term_view.status,
+        campaign.id,
+        campaign.name,
+        ad_group.id,
+        ad_group.name,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.cost_micros,
+        metrics.conversions,
+        metrics.conversions_value,
+        metrics.ctr,
+        metrics.average_cpc
+    FROM search_term_view
+    WHERE segments.date DURING {date_range}
+    {campaign_filter}
+    {impressions_filter}
+    ORDER BY metrics.cost_micros DESC
+    LIMIT {limit}
+""".split())
+
+_CAMPAIGN_METRICS_QUERY = " ".join("""
+    SELECT
+        campaign.id,
+        campaign.name,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.cost_micros,
+        metrics.conversions
+    FROM campaign
+    WHERE segments.date BETWEEN '{start}' AND '{end}'
+      AND campaign.status = 'ENABLED'
+""".split())
+
+# The customer resource returns one row already summed across the whole
+# account, so no per-campaign rows come back
+_ACCOUNT_TOTALS_QUERY = " ".join("""
+    SELECT
+        metrics.impressions,
+        metrics.clicks,
+        metrics.cost_micros,
+        metrics.conversions,
+        metrics.conversions_value
+    FROM customer
+    WHERE segments.date {date_clause}
+""".split())
+
+# Output field -> GAQL column for the tools that accept `fields`. The
+# *_REQUIRED fields are always selected; the rest only when requested
+# (default: all).
+_QUALITY_SCORE_COLUMNS = {
+    'criterion_id': 'ad_group_criterion.criterion_id',
+    'quality_score': 'ad_group_criterion.quality_info.quality_score',
+    'keyword': 'ad_group_criterion.keyword.text',
+    'match_type': 'ad_group_criterion.keyword.match_type',
+    'expected_ctr': 'ad_group_criterion.quality_info.search_predicted_ctr',
+    'ad_relevance': 'ad_group_criterion.quality_info.creative_quality_score',
+    'landing_page_experience': 'ad_group_criterion.quality_info.post_click_quality_score',
+    'campaign_id': 'campaign.id',
+    'campaign_name': 'campaign.name',
+    'ad_group_id': 'ad_group.id',
+    'ad_group_name': 'ad_group.name',
+    'impressions': 'metrics.impressions',
+    'clicks': 'metrics.clicks',
+    'cost_dollars': 'metrics.cost_micros',
+}
+_QUALITY_SCORE_REQUIRED = ('criterion_id', 'quality_score')
+
+_DISAPPROVED_AD_COLUMNS = {
+    'ad_id': 'ad_group_ad.ad.id',
+    'ad_type': 'ad_group_ad.ad.type',
+    'final_urls': 'ad_group_ad.ad.final_urls',
+    'approval_status': 'ad_group_ad.policy_summary.approval_status',
+    'review_status': 'ad_group_ad.policy_summary.review_status',
+    'policy_topics': 'ad_group_ad.policy_summary.policy_topic_entries',
+    'campaign_id': 'campaign.id',
+    'campaign_name': 'campaign.name',
+    'ad_group_id': 'ad_group.id',
+    'ad_group_name': 'ad_group.name',
+}
+_DISAPPROVED_AD_REQUIRED = ('ad_id',)
+
+
+def _select_fields(fields: Optional[List[str]], columns: Dict[str, str], required) -> List[str]:
+    """Resolve a tool's `fields` argument to the output fields to return."""
+    if not fields:
+        return list(columns)
+    unknown = [f for f in fields if f not in columns]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}. Valid fields: {', '.join(columns)}")
+    return list(dict.fromkeys((*required, *fields)))
+
+
+_QUALITY_SCORES_QUERY = " ".join("""
+    SELECT {select}
+    FROM keyword_view
+    WHERE segments.date DURING LAST_30_DAYS
+      AND ad_group_criterion.status != 'REMOVED'
+      AND ad_group.status = 'ENABLED'
+      AND campaign.status = 'ENABLED'
+    {campaign_filter}
+    {impressions_filter}
+    ORDER BY ad_group_criterion.quality_info.quality_score ASC
+    LIMIT {limit}
+""".split())
+
+_DISAPPROVED_ADS_QUERY = " ".join("""
+    SELECT {select}
+    FROM ad_group_ad
+    WHERE ad_group_ad.policy_summary.approval_status IN ('DISAPPROVED', 'AREA_OF_INTEREST_ONLY')
+      AND ad_group_ad.status != 'REMOVED'
+      AND campaign.status != 'REMOVED'
+    {campaign_filter}
+""".split())
+
+_AUCTION_INSIGHTS_QUERY = " ".join("""
+    SELECT
+        auction_insight_summary.domain,
+        auction_insight_summary.impression_share,
+        auction_insight_summary.overlap_rate,
+        auction_insight_summary.outranking_share,
+        auction_insight_summary.position_above_rate,
+        auction_insight_summary.top_of_page_rate,
+        auction_insight_summary.abs_top_of_page_rate
+    FROM auction_insight_summary
+    WHERE segments.date DURING {date_range}
+    {campaign_filter}
+""".split())
+
+
 @mcp.tool
 def run_gaql(
     customer_id: str,
@@ -40,7 +215,7 @@ def run_gaql(
 
 
 @mcp.tool
-def get_account_performance(
+async def get_account_performance(
     customer_id: str,
     date_range: str = "LAST_30_DAYS",
     compare_prior_period: bool = True,
@@ -68,39 +243,45 @@ def get_account_performance(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     if ctx:
-        ctx.info(f"Fetching account performance for customer {customer_id} ({date_range})...")
+        await ctx.info(f"Fetching account performance for customer {customer_id} ({date_range})...")
 
     try:
         formatted_customer_id = format_customer_id(customer_id)
         mgr = format_customer_id(manager_id) if manager_id else ""
 
-        def fetch(dr):
-            q = f"""
-                SELECT
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.conversions_value,
-                    metrics.all_conversions,
-                    metrics.all_conversions_value
-                FROM campaign
-                WHERE segments.date DURING {dr}
-                  AND campaign.status != 'REMOVED'
-            """
-            rows = execute_gaql(formatted_customer_id, q, mgr).get('results', [])
-            totals = {'impressions': 0, 'clicks': 0, 'cost_micros': 0,
-                      'conversions': 0.0, 'conversions_value': 0.0}
-            for row in rows:
-                m = row.get('metrics', {})
-                totals['impressions'] += int(m.get('impressions', 0))
-                totals['clicks'] += int(m.get('clicks', 0))
-                totals['cost_micros'] += int(m.get('costMicros', 0))
-                totals['conversions'] += float(m.get('conversions', 0))
-                totals['conversions_value'] += float(m.get('conversionsValue', 0))
-            return totals
-
-        current = fetch(date_range.upper())
+        # Only THIS_MONTH includes today; every other period is settled
+        cache = date_range.upper() != 'THIS_MONTH'
+
+        def fetch(date_clause):
+            q = _ACCOUNT_TOTALS_QUERY.format(date_clause=date_clause)
+            rows = execute_gaql(formatted_customer_id, q, mgr, cache=cache).get('results', [])
+            m = rows[0].get('metrics', {}) if rows else {}
+            return {
+                'impressions': int(m.get('impressions', 0)),
+                'clicks': int(m.get('clicks', 0)),
+                'cost_micros': int(m.get('costMicros', 0)),
+                'conversions': float(m.get('conversions', 0)),
+                'conversions_value': float(m.get('conversionsValue', 0)),
+            }
+
+        current_clause = f"DURING {date_range.upper()}"
+        if compare_prior_period:
+            range_to_days = {
+                'LAST_7_DAYS': 7, 'LAST_14_DAYS': 14, 'LAST_30_DAYS': 30,
+                'LAST_90_DAYS': 90, 'THIS_MONTH': 30, 'LAST_MONTH': 30
+            }
+            days = range_to_days.get(date_range.upper(), 30)
+            _, _, prior_start, prior_end = _comparison_periods(days)
+            # The current period stays DURING <range> so Google resolves it in
+            # the account's timezone; the prior window ends days before today
+            # on any clock. The two are independent; run them side by side.
+            current, prior = await asyncio.gather(
+                asyncio.to_thread(fetch, current_clause),
+                asyncio.to_thread(fetch, f"BETWEEN '{prior_start}' AND '{prior_end}'"),
+            )
+        else:
+            current = await asyncio.to_thread(fetch, current_clause)
+
         cost = current['cost_micros']
         clicks = current['clicks']
         convs = current['conversions']
@@ -122,35 +303,6 @@ def get_account_performance(
         }
 
         if compare_prior_period:
-            range_to_days = {
-                'LAST_7_DAYS': 7, 'LAST_14_DAYS': 14, 'LAST_30_DAYS': 30,
-                'LAST_90_DAYS': 90, 'THIS_MONTH': 30, 'LAST_MONTH': 30
-            }
-            days = range_to_days.get(date_range.upper(), 30)
-            from datetime import datetime, timedelta
-            today = datetime.now().date()
-            cur_end = today - timedelta(days=1)
-            cur_start = cur_end - timedelta(days=days - 1)
-            prior_end = cur_start - timedelta(days=1)
-            prior_start = prior_end - timedelta(days=days - 1)
-
-            prior_q = f"""
-                SELECT metrics.impressions, metrics.clicks, metrics.cost_micros,
-                       metrics.conversions, metrics.conversions_value
-                FROM campaign
-                WHERE segments.date BETWEEN '{prior_start}' AND '{prior_end}'
-                  AND campaign.status != 'REMOVED'
-            """
-            prior_rows = execute_gaql(formatted_customer_id, prior_q, mgr).get('results', [])
-            prior = {'impressions': 0, 'clicks': 0, 'cost_micros': 0, 'conversions': 0.0, 'conversions_value': 0.0}
-            for row in prior_rows:
-                m = row.get('metrics', {})
-                prior['impressions'] += int(m.get('impressions', 0))
-                prior['clicks'] += int(m.get('clicks', 0))
-                prior['cost_micros'] += int(m.get('costMicros', 0))
-                prior['conversions'] += float(m.get('conversions', 0))
-                prior['conversions_value'] += float(m.get('conversionsValue', 0))
-
             def pct(cur, prv):
                 if prv == 0:
                     return 100.0 if cur > 0 else 0.0
@@ -166,22 +318,23 @@ def get_account_performance(
             }
 
         if ctx:
-            ctx.info(f"Account performance fetched. Cost: ${summary['cost_dollars']}, Conversions: {summary['conversions']}")
+            await ctx.info(f"Account performance fetched. Cost: ${summary['cost_dollars']}, Conversions: {summary['conversions']}")
 
         return summary
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def get_quality_scores(
+async def get_quality_scores(
     customer_id: str,
     campaign_id: str = "",
     min_impressions: int = 0,
     limit: int = 500,
+    fields: Optional[List[str]] = None,
     manager_id: str = "",
     ctx: Context = None
 ) -> Dict[str, Any]:
@@ -196,16 +349,24 @@ def get_quality_scores(
         min_impressions: Only include keywords with at least this many impressions
             in the last 30 days (default 0 = all keywords with a QS score)
         limit: Max keywords to return (default 500)
+        fields: Optional subset of keyword fields to return, which also trims the
+            query: keyword, match_type, expected_ctr, ad_relevance,
+            landing_page_experience, campaign_id, campaign_name, ad_group_id,
+            ad_group_name, impressions, clicks, cost_dollars. criterion_id and
+            quality_score are always included. Default: all fields.
         manager_id: Manager ID if the account is accessed through an MCC
 
     Returns:
         Keywords sorted by Quality Score ascending (worst first) with sub-scores
     """
+    required = _QUALITY_SCORE_REQUIRED + (('impressions',) if min_impressions > 0 else ())
+    selected = _select_fields(fields, _QUALITY_SCORE_COLUMNS, required)
+
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     if ctx:
-        ctx.info(f"Fetching Quality Scores for customer {customer_id}...")
+        await ctx.info(f"Fetching Quality Scores for customer {customer_id}...")
 
     try:
         formatted_customer_id = format_customer_id(customer_id)
@@ -217,63 +378,22 @@ def get_quality_scores(
             f"AND metrics.impressions >= {min_impressions}" if min_impressions > 0 else ""
         )
 
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                ad_group.id,
-                ad_group.name,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.quality_info.quality_score,
-                ad_group_criterion.quality_info.creative_quality_score,
-                ad_group_criterion.quality_info.post_click_quality_score,
-                ad_group_criterion.quality_info.search_predicted_ctr,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.cost_micros
-            FROM keyword_view
-            WHERE segments.date DURING LAST_30_DAYS
-              AND ad_group_criterion.status != 'REMOVED'
-              AND ad_group.status = 'ENABLED'
-              AND campaign.status = 'ENABLED'
-              {campaign_filter}
-              {impressions_filter}
-            ORDER BY ad_group_criterion.quality_info.quality_score ASC
-            LIMIT {limit}
-        """
+        query = _QUALITY_SCORES_QUERY.format(
+            select=", ".join(_QUALITY_SCORE_COLUMNS[f] for f in selected),
+            campaign_filter=campaign_filter,
+            impressions_filter=impressions_filter,
+            limit=limit,
+        )
 
-        result = execute_gaql(formatted_customer_id, query, mgr)
+        result = await asyncio.to_thread(execute_gaql, formatted_customer_id, query, mgr)
         rows = result.get('results', [])
 
         if ctx:
-            ctx.info(f"Found {len(rows)} keyword(s) with Quality Score data.")
+            await ctx.info(f"Found {len(rows)} keyword(s) with Quality Score data.")
 
-        keywords = []
-        for row in rows:
-            c = row.get('campaign', {})
-            ag = row.get('adGroup', {})
-            agc = row.get('adGroupCriterion', {})
-            qi = agc.get('qualityInfo', {})
-            m = row.get('metrics', {})
-            cost_micros = int(m.get('costMicros', 0))
-            keywords.append({
-                'keyword': agc.get('keyword', {}).get('text', ''),
-                'match_type': agc.get('keyword', {}).get('matchType', ''),
-                'criterion_id': agc.get('criterionId', ''),
-                'quality_score': qi.get('qualityScore'),
-                'expected_ctr': qi.get('searchPredictedCtr', ''),
-                'ad_relevance': qi.get('creativeQualityScore', ''),
-                'landing_page_experience': qi.get('postClickQualityScore', ''),
-                'campaign_id': c.get('id', ''),
-                'campaign_name': c.get('name', ''),
-                'ad_group_id': ag.get('id', ''),
-                'ad_group_name': ag.get('name', ''),
-                'impressions': int(m.get('impressions', 0)),
-                'clicks': int(m.get('clicks', 0)),
-                'cost_dollars': round(cost_micros / 1_000_000, 2),
-            })
+        keywords = [_format_quality_score_row(row) for row in rows]
+        if fields:
+            keywords = [{f: kw[f] for f in selected} for kw in keywords]
 
         return {
             'keywords': keywords,
@@ -283,14 +403,15 @@ def get_quality_scores(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def get_disapproved_ads(
+async def get_disapproved_ads(
     customer_id: str,
     campaign_id: str = "",
+    fields: Optional[List[str]] = None,
     manager_id: str = "",
     ctx: Context = None
 ) -> Dict[str, Any]:
@@ -299,46 +420,39 @@ def get_disapproved_ads(
     Args:
         customer_id: The Google Ads customer ID (10 digits, no dashes)
         campaign_id: Optional campaign ID to filter to a single campaign
+        fields: Optional subset of ad fields to return, which also trims the
+            query: ad_type, final_urls, approval_status, review_status,
+            policy_topics, campaign_id, campaign_name, ad_group_id, ad_group_name.
+            ad_id is always included. Default: all fields. Leaving out
+            policy_topics saves the most, as it carries the policy evidence.
         manager_id: Manager ID if the account is accessed through an MCC
 
     Returns:
         List of disapproved ads with policy topics, campaign, and ad group context
     """
+    selected = _select_fields(fields, _DISAPPROVED_AD_COLUMNS, _DISAPPROVED_AD_REQUIRED)
+
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     if ctx:
-        ctx.info(f"Searching for disapproved ads for customer {customer_id}...")
+        await ctx.info(f"Searching for disapproved ads for customer {customer_id}...")
 
     try:
         formatted_customer_id = format_customer_id(customer_id)
         mgr = format_customer_id(manager_id) if manager_id else ""
         campaign_filter = f"AND campaign.id = {campaign_id.strip()}" if campaign_id else ""
 
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                ad_group.id,
-                ad_group.name,
-                ad_group_ad.ad.id,
-                ad_group_ad.ad.type,
-                ad_group_ad.ad.final_urls,
-                ad_group_ad.policy_summary.approval_status,
-                ad_group_ad.policy_summary.review_status,
-                ad_group_ad.policy_summary.policy_topic_entries
-            FROM ad_group_ad
-            WHERE ad_group_ad.policy_summary.approval_status IN ('DISAPPROVED', 'AREA_OF_INTEREST_ONLY')
-              AND ad_group_ad.status != 'REMOVED'
-              AND campaign.status != 'REMOVED'
-              {campaign_filter}
-        """
+        query = _DISAPPROVED_ADS_QUERY.format(
+            select=", ".join(_DISAPPROVED_AD_COLUMNS[f] for f in selected),
+            campaign_filter=campaign_filter,
+        )
 
-        result = execute_gaql(formatted_customer_id, query, mgr)
+        result = await asyncio.to_thread(execute_gaql, formatted_customer_id, query, mgr)
         rows = result.get('results', [])
 
         if ctx:
-            ctx.info(f"Found {len(rows)} disapproved ad(s).")
+            await ctx.info(f"Found {len(rows)} disapproved ad(s).")
 
         ads = []
         for row in rows:
@@ -366,6 +480,8 @@ def get_disapproved_ads(
                 'ad_group_id': ag.get('id', ''),
                 'ad_group_name': ag.get('name', ''),
             })
+        if fields:
+            ads = [{f: ad[f] for f in selected} for ad in ads]
 
         return {
             'disapproved_ads': ads,
@@ -375,12 +491,12 @@ def get_disapproved_ads(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def get_auction_insights(
+async def get_auction_insights(
     customer_id: str,
     date_range: str = "LAST_30_DAYS",
     campaign_id: str = "",
@@ -408,47 +524,41 @@ def get_auction_insights(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     if ctx:
-        ctx.info(f"Fetching auction insights for customer {customer_id} ({date_range})...")
+        await ctx.info(f"Fetching auction insights for customer {customer_id} ({date_range})...")
 
     try:
         formatted_customer_id = format_customer_id(customer_id)
         mgr = format_customer_id(manager_id) if manager_id else ""
         campaign_filter = f"AND campaign.id = {campaign_id.strip()}" if campaign_id else ""
 
-        query = f"""
-            SELECT
-                auction_insight_summary.domain,
-                auction_insight_summary.impression_share,
-                auction_insight_summary.overlap_rate,
-                auction_insight_summary.outranking_share,
-                auction_insight_summary.position_above_rate,
-                auction_insight_summary.top_of_page_rate,
-                auction_insight_summary.abs_top_of_page_rate
-            FROM auction_insight_summary
-            WHERE segments.date DURING {date_range.upper()}
-            {campaign_filter}
-        """
+        query = _AUCTION_INSIGHTS_QUERY.format(
+            date_range=date_range.upper(),
+            campaign_filter=campaign_filter,
+        )
 
-        result = execute_gaql(formatted_customer_id, query, mgr)
+        result = await asyncio.to_thread(execute_gaql, formatted_customer_id, query, mgr, cache=date_range.upper() != 'THIS_MONTH')
         rows = result.get('results', [])
 
         if ctx:
-            ctx.info(f"Found {len(rows)} competitor(s) in auction insights.")
+            await ctx.info(f"Found {len(rows)} competitor(s) in auction insights.")
 
-        competitors = []
+        # (sort key, competitor) pairs; a missing impression share sorts as 0
+        ranked = []
         for row in rows:
             ai = row.get('auctionInsightSummary', {})
-            competitors.append({
+            share = ai.get('impressionShare')
+            ranked.append((share or 0, {
                 'domain': ai.get('domain', ''),
-                'impression_share': ai.get('impressionShare'),
+                'impression_share': share,
                 'overlap_rate': ai.get('overlapRate'),
                 'outranking_share': ai.get('outrankingShare'),
                 'position_above_rate': ai.get('positionAboveRate'),
                 'top_of_page_rate': ai.get('topOfPageRate'),
                 'abs_top_of_page_rate': ai.get('absTopOfPageRate'),
-            })
+            }))
 
-        competitors.sort(key=lambda x: x.get('impression_share') or 0, reverse=True)
+        ranked.sort(key=itemgetter(0), reverse=True)
+        competitors = [c for _, c in ranked]
 
         return {
             'competitors': competitors,
@@ -460,7 +570,7 @@ def get_auction_insights(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
@@ -470,6 +580,7 @@ def get_performance_anomalies(
     current_days: int = 7,
     threshold_pct: float = 20.0,
     manager_id: str = "",
+    top_k: Optional[int] = None,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Detect campaigns with significant performance changes vs the prior period.
@@ -482,6 +593,7 @@ def get_performance_anomalies(
         current_days: Number of days in the comparison window (default 7)
         threshold_pct: Minimum % change to flag a metric as anomalous (default 20.0)
         manager_id: Manager ID if the account is accessed through an MCC
+        top_k: Optional cap (>= 1) on the number of campaigns returned (largest changes first)
 
     Returns:
         Campaigns with anomalies, showing which metrics changed and by how much,
@@ -489,6 +601,8 @@ def get_performance_anomalies(
     """
     if current_days < 1 or current_days > 90:
         raise ValueError("current_days must be between 1 and 90.")
+    if top_k is not None and top_k < 1:
+        raise ValueError("top_k must be at least 1.")
 
     if ctx:
         ctx.info(f"Comparing last {current_days} days vs prior {current_days} days for customer {customer_id}...")
@@ -497,57 +611,54 @@ def get_performance_anomalies(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        from datetime import datetime, timedelta
-
         formatted_customer_id = format_customer_id(customer_id)
         mgr = format_customer_id(manager_id) if manager_id else ""
 
-        today = datetime.now().date()
-        current_end = today - timedelta(days=1)
-        current_start = current_end - timedelta(days=current_days - 1)
-        prior_end = current_start - timedelta(days=1)
-        prior_start = prior_end - timedelta(days=current_days - 1)
+        current_start, current_end, prior_start, prior_end = _comparison_periods(current_days)
 
         def fetch_metrics(start, end):
-            q = f"""
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.cost_micros,
-                    metrics.conversions
-                FROM campaign
-                WHERE segments.date BETWEEN '{start}' AND '{end}'
-                  AND campaign.status = 'ENABLED'
-            """
-            r = execute_gaql(formatted_customer_id, q, mgr)
-            by_id = {}
+            q = _CAMPAIGN_METRICS_QUERY.format(start=start, end=end)
+            # Only the prior window is settled: the current one ends
+            # yesterday by the server's clock, which can still be today in
+            # the account's timezone
+            r = execute_gaql(formatted_customer_id, q, mgr, cache=end < current_end)
+            # Per campaign: [name, impressions, clicks, cost_micros, conversions]
+            totals = defaultdict(lambda: ['', 0, 0, 0, 0.0])
             for row in r.get('results', []):
                 c = row.get('campaign', {})
                 m = row.get('metrics', {})
-                cid = str(c.get('id', ''))
-                if cid not in by_id:
-                    by_id[cid] = {
-                        'campaign_name': c.get('name', ''),
-                        'impressions': 0, 'clicks': 0, 'cost_micros': 0, 'conversions': 0.0
-                    }
-                by_id[cid]['impressions'] += int(m.get('impressions', 0))
-                by_id[cid]['clicks'] += int(m.get('clicks', 0))
-                by_id[cid]['cost_micros'] += int(m.get('costMicros', 0))
-                by_id[cid]['conversions'] += float(m.get('conversions', 0))
-            return by_id
+                acc = totals[str(c.get('id', ''))]
+                acc[0] = c.get('name', '')
+                acc[1] += int(m.get('impressions', 0))
+                acc[2] += int(m.get('clicks', 0))
+                acc[3] += int(m.get('costMicros', 0))
+                acc[4] += float(m.get('conversions', 0))
+            return {
+                cid: {
+                    'campaign_name': name,
+                    'impressions': impressions, 'clicks': clicks,
+                    'cost_micros': cost_micros, 'conversions': conversions
+                }
+                for cid, (name, impressions, clicks, cost_micros, conversions) in totals.items()
+            }
 
-        current = fetch_metrics(current_start, current_end)
-        prior = fetch_metrics(prior_start, prior_end)
+        # The two periods are independent queries; run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(fetch_metrics, current_start, current_end)
+            prior_future = executor.submit(fetch_metrics, prior_start, prior_end)
+            current = current_future.result()
+            prior = prior_future.result()
 
         if ctx:
             ctx.info(f"Analysing {len(current)} active campaign(s)...")
 
-        anomalies = []
+        # (largest absolute change, anomaly) pairs, so the sort key is
+        # tracked while scanning instead of recomputed from the dicts
+        flagged = []
         for cid, cur in current.items():
             pri = prior.get(cid, {})
             campaign_anomalies = {}
+            peak = 0.0
             for metric in ('impressions', 'clicks', 'cost_micros', 'conversions'):
                 cur_val = cur.get(metric, 0)
                 pri_val = pri.get(metric, 0)
@@ -559,29 +670,33 @@ def get_performance_anomalies(
                 else:
                     pct_change = ((cur_val - pri_val) / abs(pri_val)) * 100
                 if abs(pct_change) >= threshold_pct:
+                    change_pct = round(pct_change, 1)
                     campaign_anomalies[metric] = {
                         'current': cur_val,
                         'prior': pri_val,
-                        'change_pct': round(pct_change, 1)
+                        'change_pct': change_pct
                     }
+                    peak = max(peak, abs(change_pct))
             if campaign_anomalies:
-                anomalies.append({
+                flagged.append((peak, {
                     'campaign_id': cid,
                     'campaign_name': cur.get('campaign_name', ''),
                     'anomalies': campaign_anomalies
-                })
+                }))
 
-        anomalies.sort(
-            key=lambda x: max(abs(v['change_pct']) for v in x['anomalies'].values()),
-            reverse=True
-        )
+        total_flagged = len(flagged)
+        if top_k is not None:
+            flagged = heapq.nlargest(top_k, flagged, key=itemgetter(0))
+        else:
+            flagged.sort(key=itemgetter(0), reverse=True)
+        anomalies = [anomaly for _, anomaly in flagged]
 
         if ctx:
-            ctx.info(f"Found {len(anomalies)} campaign(s) with anomalies (threshold: {threshold_pct}%).")
+            ctx.info(f"Found {total_flagged} campaign(s) with anomalies (threshold: {threshold_pct}%).")
 
         return {
             'anomalies': anomalies,
-            'campaigns_with_anomalies': len(anomalies),
+            'campaigns_with_anomalies': total_flagged,
             'current_period': f"{current_start} to {current_end}",
             'prior_period': f"{prior_start} to {prior_end}",
             'threshold_pct': threshold_pct,
@@ -636,30 +751,15 @@ def get_search_terms_report(
         campaign_filter = f"AND campaign.id = {campaign_id.strip()}" if campaign_id else ""
         impressions_filter = f"AND metrics.impressions >= {min_impressions}" if min_impressions > 0 else ""
 
-        query = f"""
-            SELECT
-                search_term_view.search_term,
-                search_term_view.status,
-                campaign.id,
-                campaign.name,
-                ad_group.id,
-                ad_group.name,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.ctr,
-                metrics.average_cpc
-            FROM search_term_view
-            WHERE segments.date DURING {date_range.upper()}
-            {campaign_filter}
-            {impressions_filter}
-            ORDER BY metrics.cost_micros DESC
-            LIMIT {limit}
-        """
+        query = _SEARCH_TERMS_QUERY.format(
+            date_range=date_range.upper(),
+            campaign_filter=campaign_filter,
+            impressions_filter=impressions_filter,
+            limit=limit,
+        )
 
-        result = execute_gaql(formatted_customer_id, query, mgr)
+        # THIS_MONTH still accumulates today's traffic
+        result = execute_gaql(formatted_customer_id, query, mgr, cache=date_range.upper() != 'THIS_MONTH')
         rows = result.get('results', [])
 
         if ctx:
@@ -817,7 +917,6 @@ def get_budget_pacing(
     if ctx:
         ctx.info(f"Fetching budget pacing for customer {customer_id}...")
     try:
-        from datetime import datetime
         formatted_customer_id = format_customer_id(customer_id)
         mgr = format_customer_id(manager_id) if manager_id else ""
         query = """
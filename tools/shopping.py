@@ -1,13 +1,12 @@
 """Shopping campaign tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -38,12 +37,10 @@ def create_shopping_campaign(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         # Step 1: Create budget
         budget_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaignBudgets:mutate"
-        budget_resp = _make_request(requests.post, budget_url, headers, {
+        budget_resp = _make_request(_session.post, budget_url, headers, {
             "operations": [{
                 "create": {
                     "name": f"{name} Budget",
@@ -54,9 +51,9 @@ def create_shopping_campaign(
             }]
         })
         if not budget_resp.ok:
-            raise Exception(f"Budget creation error: {budget_resp.status_code} {budget_resp.text}")
+            raise Exception(f"Budget creation error: {budget_resp.status_code} {_error_body(budget_resp)}")
 
-        budget_resource = budget_resp.json()["results"][0]["resourceName"]
+        budget_resource = _json_loads(budget_resp)["results"][0]["resourceName"]
 
         # Step 2: Create campaign
         campaign_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/campaigns:mutate"
@@ -79,13 +76,13 @@ def create_shopping_campaign(
         else:
             campaign_data["manualCpc"] = {"enhancedCpcEnabled": True}
 
-        campaign_resp = _make_request(requests.post, campaign_url, headers, {
+        campaign_resp = _make_request(_session.post, campaign_url, headers, {
             "operations": [{"create": campaign_data}]
         })
         if not campaign_resp.ok:
-            raise Exception(f"Campaign creation error: {campaign_resp.status_code} {campaign_resp.text}")
+            raise Exception(f"Campaign creation error: {campaign_resp.status_code} {_error_body(campaign_resp)}")
 
-        campaign_resource = campaign_resp.json()["results"][0]["resourceName"]
+        campaign_resource = _json_loads(campaign_resp)["results"][0]["resourceName"]
         campaign_id = campaign_resource.split("/")[-1]
 
         if ctx:
@@ -1,13 +1,12 @@
 """Utility tools for Google Ads MCP Server."""
 import logging
-import requests
 from typing import Any, Dict, List
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _session,
 )
 
 logger = logging.getLogger(__name__)
@@ -116,8 +115,6 @@ def preview_ad_targeting(
         mgr = format_customer_id(manager_id) if manager_id else ""
 
         headers = get_headers_with_auto_token(cid, mgr)
-        if mgr:
-            headers["login-customer-id"] = mgr
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{cid}/googleAds:generate"
 
@@ -132,7 +129,7 @@ def preview_ad_targeting(
             }
         }
 
-        resp = _make_request(requests.post, preview_url, headers, body)
+        resp = _make_request(_session.post, preview_url, headers, body)
 
         if ctx:
             ctx.info("Ad preview request completed.")
@@ -142,7 +139,7 @@ def preview_ad_targeting(
                 "query_text": query_text,
                 "country_code": country_code,
                 "device": device,
-                "preview_data": resp.json(),
+                "preview_data": _json_loads(resp),
                 "customer_id": customer_id,
             }
         else:
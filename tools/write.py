@@ -1,17 +1,215 @@
-import requests
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from fastmcp import Context
 from mcp_instance import mcp
 from oauth.google_auth import (
     format_customer_id, get_headers_with_auto_token,
     execute_gaql, API_VERSION, GOOGLE_ADS_DEVELOPER_TOKEN,
-    _make_request,
+    _make_request, _json_loads, _error_body, _session,
 )
 
 logger = logging.getLogger(__name__)
 
+# Keyword Planner month enum values, indexed by month number - 1
+_MONTH_NAMES = (
+    'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE',
+    'JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER',
+)
+VALID_MONTHS = frozenset(_MONTH_NAMES)
+
+VALID_MATCH_TYPES = frozenset({'BROAD', 'PHRASE', 'EXACT'})
+VALID_CAMPAIGN_STATUSES = frozenset({'ENABLED', 'PAUSED'})
+VALID_CHANNEL_TYPES = frozenset({'SEARCH', 'DISPLAY', 'VIDEO', 'SHOPPING', 'PERFORMANCE_MAX'})
+VALID_BIDDING_STRATEGIES = frozenset({
+    'MANUAL_CPC', 'TARGET_CPA', 'TARGET_ROAS', 'MAXIMIZE_CONVERSIONS', 'MAXIMIZE_CONVERSION_VALUE',
+})
+# Campaign field and fixed value for the strategies that take no target
+_BIDDING_STRATEGY_FIELDS = {
+    'MANUAL_CPC': ('manualCpc', {"enhancedCpcEnabled": False}),
+    'MAXIMIZE_CONVERSIONS': ('maximizeConversions', {}),
+    'MAXIMIZE_CONVERSION_VALUE': ('maximizeConversionValue', {}),
+}
+VALID_DAYS = frozenset({'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY'})
+VALID_MINUTES = frozenset({'ZERO', 'FIFTEEN', 'THIRTY', 'FORTY_FIVE'})
+VALID_AGE_RANGES = frozenset({
+    'AGE_RANGE_18_24', 'AGE_RANGE_25_34', 'AGE_RANGE_35_44',
+    'AGE_RANGE_45_54', 'AGE_RANGE_55_64', 'AGE_RANGE_65_UP', 'AGE_RANGE_UNDETERMINED',
+})
+VALID_GENDERS = frozenset({'MALE', 'FEMALE', 'UNDETERMINED'})
+
+# Sitelink text fields and their maximum lengths
+_SITELINK_LIMITS = (('link_text', 25), ('description1', 35), ('description2', 35))
+
+# Fixed criterion IDs Google Ads uses for device targeting; every campaign's
+# device criterion is campaignCriteria/{campaign_id}~{id}
+_DEVICE_CRITERION_IDS = {'DESKTOP': 30000, 'MOBILE': 30001, 'TABLET': 30002}
+# Likewise for demographics, keyed by age range / gender enum value
+_AGE_RANGE_CRITERION_IDS = {
+    'AGE_RANGE_18_24': 503001, 'AGE_RANGE_25_34': 503002, 'AGE_RANGE_35_44': 503003,
+    'AGE_RANGE_45_54': 503004, 'AGE_RANGE_55_64': 503005, 'AGE_RANGE_65_UP': 503006,
+    'AGE_RANGE_UNDETERMINED': 503999,
+}
+_GENDER_CRITERION_IDS = {'MALE': 10, 'FEMALE': 11, 'UNDETERMINED': 20}
+
+# Google Ads rejects mutate requests with more than 5000 operations
+_MAX_MUTATE_OPERATIONS = 5000
+# Chunks of one oversized mutate sent at the same time
+_MAX_CONCURRENT_MUTATES = 4
+
+
+def _partial_failure_errors(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract per-operation errors from a partialFailure mutate response."""
+    errors = []
+    for detail in data.get('partialFailureError', {}).get('details', []):
+        for err in detail.get('errors', []):
+            path = err.get('location', {}).get('fieldPathElements', [])
+            index = next((p.get('index') for p in path if p.get('fieldName') == 'operations'), None)
+            errors.append({'operation_index': index, 'message': err.get('message', '')})
+    return errors
+
+
+def _not_found_operations(response) -> Optional[Set[Optional[int]]]:
+    """Indices of the operations a failed mutate rejected as RESOURCE_NOT_FOUND.
+
+    None unless every error in the response is RESOURCE_NOT_FOUND. An index
+    is None when the error doesn't point at a specific operation.
+    """
+    try:
+        body = _json_loads(response)
+    except ValueError:
+        return None
+    if not isinstance(body, dict):
+        return None
+    indices = set()
+    for detail in body.get('error', {}).get('details', []):
+        for err in detail.get('errors', []):
+            if err.get('errorCode', {}).get('mutateError') != 'RESOURCE_NOT_FOUND':
+                return None
+            path = err.get('location', {}).get('fieldPathElements', [])
+            indices.add(next((p.get('index') for p in path if p.get('fieldName') == 'operations'), None))
+    return indices or None
+
+
+def _resource_not_found(response) -> bool:
+    """True if a failed mutate was rejected only because a resource doesn't exist.
+
+    Used by the update-by-known-resource-name tools to decide whether to fall
+    back to creating the criterion instead.
+    """
+    return _not_found_operations(response) is not None
+
+
+async def _mutate_chunked(url: str, headers: Dict[str, str], operations: List[Dict[str, Any]], action: str,
+                          partial_failure: bool = False) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """POST operations in chunks the API accepts.
+
+    Returns (result resource names, per-operation errors). Chunks go out
+    concurrently (up to _MAX_CONCURRENT_MUTATES at a time). Each chunk is
+    atomic on its own unless partial_failure is set, so if one fails the
+    error notes how many operations in the other chunks were applied. With
+    partial_failure, invalid operations are skipped and reported in the
+    errors list, with operation_index pointing into `operations`.
+    """
+    chunks = [operations[i:i + _MAX_MUTATE_OPERATIONS] for i in range(0, len(operations), _MAX_MUTATE_OPERATIONS)]
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_MUTATES)
+    extra = {"partialFailure": True} if partial_failure else {}
+
+    async def post(chunk):
+        async with semaphore:
+            return await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": chunk, **extra})
+
+    responses = await asyncio.gather(*(post(chunk) for chunk in chunks))
+
+    failed = next((r for r in responses if not r.ok), None)
+    if failed is not None:
+        applied = sum(len(chunk) for chunk, r in zip(chunks, responses) if r.ok)
+        note = f" ({applied} operation(s) in other batches were applied)" if applied else ""
+        raise Exception(f"Error {action}: {failed.status_code} {failed.reason} - {_error_body(failed)}{note}")
+
+    names = []
+    errors = []
+    for offset, response in zip(range(0, len(operations), _MAX_MUTATE_OPERATIONS), responses):
+        data = _json_loads(response)
+        # Operations skipped under partialFailure come back as empty results
+        names.extend(r['resourceName'] for r in data.get('results', []) if r.get('resourceName'))
+        for err in _partial_failure_errors(data):
+            if err['operation_index'] is not None:
+                err['operation_index'] += offset
+            errors.append(err)
+    return names, errors
+
+
+def _campaign_asset_mutate_operations(formatted_customer_id: str, campaign_id: str,
+                                      assets: List[Dict[str, Any]], field_type: str) -> List[Dict[str, Any]]:
+    """Build googleAds:mutate operations that create assets and link them to a campaign.
+
+    Each asset gets a temporary (negative) resource name that its campaign
+    asset link references, so both steps go out as one atomic request.
+    """
+    campaign = f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}"
+    temp_names = [f"customers/{formatted_customer_id}/assets/-{i}" for i in range(1, len(assets) + 1)]
+    operations = [
+        {"assetOperation": {"create": {"resourceName": rn, **asset}}}
+        for rn, asset in zip(temp_names, assets)
+    ]
+    operations.extend(
+        {"campaignAssetOperation": {"create": {"asset": rn, "campaign": campaign, "fieldType": field_type}}}
+        for rn in temp_names
+    )
+    return operations
+
+
+def _campaign_asset_results(data: Dict[str, Any]):
+    """Split a googleAds:mutate response into (asset, campaign asset) resource names."""
+    asset_rns, link_rns = [], []
+    for r in data.get('mutateOperationResponses', []):
+        if 'assetResult' in r:
+            asset_rns.append(r['assetResult'].get('resourceName', ''))
+        elif 'campaignAssetResult' in r:
+            link_rns.append(r['campaignAssetResult'].get('resourceName', ''))
+    return asset_rns, link_rns
+
+
+def _bidding_strategy_field(bidding_strategy: str, target_cpa_micros: Optional[int] = None, target_roas: Optional[float] = None):
+    """Return the (campaign field, value) that sets a VALID_BIDDING_STRATEGIES strategy."""
+    if bidding_strategy == 'TARGET_CPA':
+        return 'targetCpa', {"targetCpaMicros": str(target_cpa_micros)}
+    if bidding_strategy == 'TARGET_ROAS':
+        return 'targetRoas', {"targetRoas": target_roas}
+    field, value = _BIDDING_STRATEGY_FIELDS[bidding_strategy]
+    return field, dict(value)
+
+
+def _validate_bid_adjustment(adjustment_type: str, bid_modifier: float, device_type: str, geo_target_id: int):
+    """Validate one bid adjustment; return the upper-cased (adjustment_type, device_type)."""
+    adjustment_type = adjustment_type.upper()
+    if adjustment_type not in ('DEVICE', 'LOCATION'):
+        raise ValueError("adjustment_type must be 'DEVICE' or 'LOCATION'.")
+    if bid_modifier < 0.0 or bid_modifier > 10.0:
+        raise ValueError("bid_modifier must be between 0.0 and 10.0.")
+    if adjustment_type == 'DEVICE':
+        device_type = device_type.upper()
+        if device_type not in _DEVICE_CRITERION_IDS:
+            raise ValueError("device_type must be MOBILE, TABLET, or DESKTOP when adjustment_type=DEVICE.")
+    if adjustment_type == 'LOCATION' and not geo_target_id:
+        raise ValueError("geo_target_id is required when adjustment_type=LOCATION.")
+    return adjustment_type, device_type
+
+
+def _format_keyword_idea(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a generateKeywordIdeas result to the fields the tool returns."""
+    keyword_idea = result.get('keywordIdeaMetrics', {})
+    return {
+        'keyword': result.get('text', 'N/A'),
+        'avg_monthly_searches': keyword_idea.get('avgMonthlySearches', 'N/A'),
+        'competition': keyword_idea.get('competition', 'N/A'),
+        'competition_index': keyword_idea.get('competitionIndex', 'N/A'),
+        'low_top_of_page_bid_micros': keyword_idea.get('lowTopOfPageBidMicros', 'N/A'),
+        'high_top_of_page_bid_micros': keyword_idea.get('highTopOfPageBidMicros', 'N/A')
+    }
+
 
 @mcp.tool
 def run_keyword_planner(
@@ -77,24 +275,21 @@ def run_keyword_planner(
     page_size = max(1, min(page_size, 10000))
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = get_headers_with_auto_token(customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}:generateKeywordIdeas"
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         current_date = datetime.now()
         current_year = current_date.year
-        current_month = current_date.strftime('%B').upper()
+        current_month = _MONTH_NAMES[current_date.month - 1]
 
-        valid_months = ['JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE',
-                        'JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER']
+        start_month = (start_month or '').upper()
+        end_month = (end_month or '').upper()
 
         start_year_final = start_year or (current_year - 1)
-        start_month_final = start_month.upper() if start_month and start_month.upper() in valid_months else 'JANUARY'
+        start_month_final = start_month if start_month in VALID_MONTHS else 'JANUARY'
         end_year_final = end_year or current_year
-        end_month_final = end_month.upper() if end_month and end_month.upper() in valid_months else current_month
+        end_month_final = end_month if end_month in VALID_MONTHS else current_month
 
         request_body = {
             'language': f'languageConstants/{language_id}',
@@ -117,14 +312,14 @@ def run_keyword_planner(
         elif keywords and len(keywords) > 0 and page_url:
             request_body['keywordAndUrlSeed'] = {'url': page_url, 'keywords': keywords}
 
-        response = _make_request(requests.post, url, headers, json_body=request_body)
+        response = _make_request(_session.post, url, headers, json_body=request_body)
 
         if not response.ok:
             if ctx:
                 ctx.error(f"Keyword planner request failed: {response.status_code} {response.reason}")
-            raise Exception(f"Error executing request: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error executing request: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        results = response.json()
+        results = _json_loads(response)
 
         if 'results' not in results or not results['results']:
             message = (
@@ -142,17 +337,10 @@ def run_keyword_planner(
                 "date_range": f"{start_month_final} {start_year_final} to {end_month_final} {end_year_final}"
             }
 
-        formatted_results = []
-        for result in results['results']:
-            keyword_idea = result.get('keywordIdeaMetrics', {})
-            formatted_results.append({
-                'keyword': result.get('text', 'N/A'),
-                'avg_monthly_searches': keyword_idea.get('avgMonthlySearches', 'N/A'),
-                'competition': keyword_idea.get('competition', 'N/A'),
-                'competition_index': keyword_idea.get('competitionIndex', 'N/A'),
-                'low_top_of_page_bid_micros': keyword_idea.get('lowTopOfPageBidMicros', 'N/A'),
-                'high_top_of_page_bid_micros': keyword_idea.get('highTopOfPageBidMicros', 'N/A')
-            })
+        # Drop the parsed response (which includes per-month search volumes
+        # for every idea) as soon as the slim records are built
+        formatted_results = [_format_keyword_idea(result) for result in results.pop('results')]
+        del results
 
         if ctx:
             ctx.info(f"Found {len(formatted_results)} keyword ideas.")
@@ -174,7 +362,7 @@ def run_keyword_planner(
 
 
 @mcp.tool
-def set_campaign_status(
+async def set_campaign_status(
     customer_id: str,
     campaign_ids: List[str],
     status: str,
@@ -193,58 +381,62 @@ def set_campaign_status(
         A summary of which campaigns were updated successfully and any failures
     """
     status = status.upper()
-    if status not in ('ENABLED', 'PAUSED'):
+    if status not in VALID_CAMPAIGN_STATUSES:
         raise ValueError(f"Invalid status '{status}'. Must be 'ENABLED' or 'PAUSED'.")
     if not campaign_ids:
         raise ValueError("campaign_ids must not be empty.")
 
     if ctx:
-        ctx.info(f"Setting {len(campaign_ids)} campaign(s) to {status} for customer {customer_id}...")
+        await ctx.info(f"Setting {len(campaign_ids)} campaign(s) to {status} for customer {customer_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaigns:mutate"
+        ids = [cid.strip() for cid in campaign_ids]
+        campaign_prefix = f"customers/{formatted_customer_id}/campaigns/"
         operations = [
             {
                 "update": {
-                    "resourceName": f"customers/{formatted_customer_id}/campaigns/{cid.strip()}",
+                    "resourceName": campaign_prefix + cid,
                     "status": status
                 },
                 "updateMask": "status"
             }
-            for cid in campaign_ids
+            for cid in ids
         ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
-
-        if not response.ok:
-            if ctx:
-                ctx.error(f"Campaign mutate request failed: {response.status_code} {response.reason}")
-            raise Exception(f"Error mutating campaigns: {response.status_code} {response.reason} - {response.text}")
-
-        updated = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        # partialFailure lets valid campaigns update even if some IDs are bad
+        updated, errors = await _mutate_chunked(url, headers, operations, "mutating campaigns", partial_failure=True)
+        failures = []
+        for err in errors:
+            idx = err['operation_index']
+            failures.append({
+                "campaign_id": ids[idx] if idx is not None and idx < len(ids) else None,
+                "error": err['message']
+            })
 
         if ctx:
-            ctx.info(f"Successfully updated {len(updated)} campaign(s) to {status}.")
+            await ctx.info(f"Successfully updated {len(updated)} campaign(s) to {status}.")
+            if failures:
+                await ctx.info(f"{len(failures)} campaign update(s) failed.")
 
         return {
             "status_set": status,
             "campaigns_updated": len(updated),
             "updated_resource_names": updated,
+            "campaigns_failed": len(failures),
+            "failures": failures,
             "customer_id": formatted_customer_id
         }
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
@@ -272,12 +464,14 @@ def add_keywords(
     if not keywords:
         raise ValueError("keywords list must not be empty.")
 
-    valid_match_types = {'BROAD', 'PHRASE', 'EXACT'}
+    match_types = []
     for kw in keywords:
         if 'text' not in kw or 'match_type' not in kw:
             raise ValueError("Each keyword must have 'text' and 'match_type' fields.")
-        if kw['match_type'].upper() not in valid_match_types:
+        match_type = kw['match_type'].upper()
+        if match_type not in VALID_MATCH_TYPES:
             raise ValueError(f"Invalid match_type '{kw['match_type']}'. Must be one of: BROAD, PHRASE, EXACT")
+        match_types.append(match_type)
 
     if ctx:
         ctx.info(f"Adding {len(keywords)} keyword(s) to ad group {ad_group_id} for customer {customer_id}...")
@@ -286,33 +480,31 @@ def add_keywords(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = get_headers_with_auto_token(customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroupCriteria:mutate"
+        ad_group = f"customers/{formatted_customer_id}/adGroups/{ad_group_id.strip()}"
         operations = [
             {
                 "create": {
-                    "adGroup": f"customers/{formatted_customer_id}/adGroups/{ad_group_id.strip()}",
+                    "adGroup": ad_group,
                     "status": "ENABLED",
                     "keyword": {
                         "text": kw['text'],
-                        "matchType": kw['match_type'].upper()
+                        "matchType": match_type
                     }
                 }
             }
-            for kw in keywords
+            for kw, match_type in zip(keywords, match_types)
         ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
+        response = _make_request(_session.post, url, headers, json_body={"operations": operations})
 
         if not response.ok:
-            raise Exception(f"Error adding keywords: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error adding keywords: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        created = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        created = [r.get('resourceName', '') for r in _json_loads(response).get('results', [])]
 
         if ctx:
             ctx.info(f"Successfully added {len(created)} keyword(s).")
@@ -360,12 +552,14 @@ def add_negative_keywords(
     if campaign_id and ad_group_id:
         raise ValueError("Provide either campaign_id or ad_group_id, not both.")
 
-    valid_match_types = {'BROAD', 'PHRASE', 'EXACT'}
+    match_types = []
     for kw in keywords:
         if 'text' not in kw or 'match_type' not in kw:
             raise ValueError("Each keyword must have 'text' and 'match_type' fields.")
-        if kw['match_type'].upper() not in valid_match_types:
+        match_type = kw['match_type'].upper()
+        if match_type not in VALID_MATCH_TYPES:
             raise ValueError(f"Invalid match_type '{kw['match_type']}'. Must be one of: BROAD, PHRASE, EXACT")
+        match_types.append(match_type)
 
     level = "campaign" if campaign_id else "ad group"
     if ctx:
@@ -375,43 +569,36 @@ def add_negative_keywords(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = get_headers_with_auto_token(customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         if campaign_id:
-            url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
-            operations = [
-                {
-                    "create": {
-                        "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
-                        "negative": True,
-                        "keyword": {"text": kw['text'], "matchType": kw['match_type'].upper()}
-                    }
-                }
-                for kw in keywords
-            ]
+            service = "campaignCriteria"
+            parent_field = "campaign"
+            parent = f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}"
         else:
-            url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroupCriteria:mutate"
-            operations = [
-                {
-                    "create": {
-                        "adGroup": f"customers/{formatted_customer_id}/adGroups/{ad_group_id.strip()}",
-                        "negative": True,
-                        "keyword": {"text": kw['text'], "matchType": kw['match_type'].upper()}
-                    }
+            service = "adGroupCriteria"
+            parent_field = "adGroup"
+            parent = f"customers/{formatted_customer_id}/adGroups/{ad_group_id.strip()}"
+
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/{service}:mutate"
+        operations = [
+            {
+                "create": {
+                    parent_field: parent,
+                    "negative": True,
+                    "keyword": {"text": kw['text'], "matchType": match_type}
                 }
-                for kw in keywords
-            ]
+            }
+            for kw, match_type in zip(keywords, match_types)
+        ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
+        response = _make_request(_session.post, url, headers, json_body={"operations": operations})
 
         if not response.ok:
-            raise Exception(f"Error adding negative keywords: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error adding negative keywords: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        created = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        created = [r.get('resourceName', '') for r in _json_loads(response).get('results', [])]
 
         if ctx:
             ctx.info(f"Successfully added {len(created)} negative keyword(s) at {level} level.")
@@ -437,6 +624,7 @@ def update_campaign_budget(
     campaign_id: str,
     new_daily_budget_micros: int,
     manager_id: str = "",
+    budget_resource_name: str = "",
     ctx: Context = None
 ) -> Dict[str, Any]:
     """Update the daily budget for a campaign.
@@ -450,6 +638,9 @@ def update_campaign_budget(
         new_daily_budget_micros: New daily budget in micros (1,000,000 micros = $1.00).
             Example: 50000000 = $50/day
         manager_id: Manager ID if the account is accessed through an MCC
+        budget_resource_name: Optional budget resource name
+            (customers/{customer_id}/campaignBudgets/{budget_id}) if already known,
+            e.g. from run_gaql on campaign.campaign_budget. Skips the budget lookup query.
 
     Returns:
         The updated budget resource name and new daily amount
@@ -457,7 +648,7 @@ def update_campaign_budget(
     if new_daily_budget_micros <= 0:
         raise ValueError("new_daily_budget_micros must be a positive integer.")
 
-    if ctx:
+    if ctx and not budget_resource_name:
         ctx.info(f"Looking up budget for campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
@@ -467,22 +658,22 @@ def update_campaign_budget(
         formatted_customer_id = format_customer_id(customer_id)
         mgr = format_customer_id(manager_id) if manager_id else ""
 
-        query = f"SELECT campaign.campaign_budget FROM campaign WHERE campaign.id = {campaign_id.strip()}"
-        result = execute_gaql(formatted_customer_id, query, mgr)
-        rows = result.get('results', [])
-        if not rows:
-            raise Exception(f"No campaign found with ID {campaign_id} for customer {formatted_customer_id}.")
-
-        budget_resource = rows[0].get('campaign', {}).get('campaignBudget', '')
+        budget_resource = budget_resource_name.strip()
         if not budget_resource:
-            raise Exception(f"Could not retrieve budget resource name for campaign {campaign_id}.")
+            query = f"SELECT campaign.campaign_budget FROM campaign WHERE campaign.id = {campaign_id.strip()}"
+            result = execute_gaql(formatted_customer_id, query, mgr)
+            rows = result.get('results', [])
+            if not rows:
+                raise Exception(f"No campaign found with ID {campaign_id} for customer {formatted_customer_id}.")
+
+            budget_resource = rows[0].get('campaign', {}).get('campaignBudget', '')
+            if not budget_resource:
+                raise Exception(f"Could not retrieve budget resource name for campaign {campaign_id}.")
 
         if ctx:
             ctx.info(f"Found budget: {budget_resource}. Updating to {new_daily_budget_micros} micros (${round(new_daily_budget_micros / 1_000_000, 2)}/day)...")
 
-        headers = get_headers_with_auto_token()
-        if manager_id:
-            headers['login-customer-id'] = mgr
+        headers = get_headers_with_auto_token(customer_id, manager_id)
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignBudgets:mutate"
         operations = [
@@ -495,12 +686,12 @@ def update_campaign_budget(
             }
         ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
+        response = _make_request(_session.post, url, headers, json_body={"operations": operations})
 
         if not response.ok:
-            raise Exception(f"Error updating budget: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error updating budget: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        updated = response.json().get('results', [{}])[0].get('resourceName', budget_resource)
+        updated = _json_loads(response).get('results', [{}])[0].get('resourceName', budget_resource)
 
         if ctx:
             ctx.info("Budget updated successfully.")
@@ -546,12 +737,12 @@ def create_responsive_search_ad(
         raise ValueError(f"RSA requires 3-15 headlines, got {len(headlines)}.")
     if len(descriptions) < 2 or len(descriptions) > 4:
         raise ValueError(f"RSA requires 2-4 descriptions, got {len(descriptions)}.")
-    for h in headlines:
-        if len(h) > 30:
-            raise ValueError(f"Headline too long (max 30 chars): '{h}' ({len(h)} chars)")
-    for d in descriptions:
-        if len(d) > 90:
-            raise ValueError(f"Description too long (max 90 chars): '{d}' ({len(d)} chars)")
+    too_long = next((h for h in headlines if len(h) > 30), None)
+    if too_long is not None:
+        raise ValueError(f"Headline too long (max 30 chars): '{too_long}' ({len(too_long)} chars)")
+    too_long = next((d for d in descriptions if len(d) > 90), None)
+    if too_long is not None:
+        raise ValueError(f"Description too long (max 90 chars): '{too_long}' ({len(too_long)} chars)")
 
     if ctx:
         ctx.info(f"Creating RSA in ad group {ad_group_id} for customer {customer_id}...")
@@ -560,12 +751,9 @@ def create_responsive_search_ad(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = get_headers_with_auto_token(customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroupAds:mutate"
         operation = {
             "create": {
@@ -581,12 +769,12 @@ def create_responsive_search_ad(
             }
         }
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": [operation]})
+        response = _make_request(_session.post, url, headers, json_body={"operations": [operation]})
 
         if not response.ok:
-            raise Exception(f"Error creating RSA: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error creating RSA: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        resource_name = response.json().get('results', [{}])[0].get('resourceName', '')
+        resource_name = _json_loads(response).get('results', [{}])[0].get('resourceName', '')
 
         if ctx:
             ctx.info(f"RSA created successfully: {resource_name}")
@@ -607,7 +795,7 @@ def create_responsive_search_ad(
 
 
 @mcp.tool
-def update_keyword_bid(
+async def update_keyword_bid(
     customer_id: str,
     keywords: List[Dict[str, Any]],
     manager_id: str = "",
@@ -630,47 +818,44 @@ def update_keyword_bid(
     """
     if not keywords:
         raise ValueError("keywords list must not be empty.")
+    # (ad_group_id, criterion_id, bid) per keyword, normalized while validating
+    bids = []
     for kw in keywords:
         for field in ('ad_group_id', 'criterion_id', 'cpc_bid_micros'):
             if field not in kw:
                 raise ValueError(f"Each keyword dict must have '{field}'.")
-        if int(kw['cpc_bid_micros']) <= 0:
+        bid = int(kw['cpc_bid_micros'])
+        if bid <= 0:
             raise ValueError("cpc_bid_micros must be a positive integer.")
+        bids.append((kw['ad_group_id'].strip(), kw['criterion_id'].strip(), str(bid)))
 
     if ctx:
-        ctx.info(f"Updating bids for {len(keywords)} keyword(s) for customer {customer_id}...")
+        await ctx.info(f"Updating bids for {len(keywords)} keyword(s) for customer {customer_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroupCriteria:mutate"
+        criterion_prefix = f"customers/{formatted_customer_id}/adGroupCriteria/"
         operations = [
             {
                 "update": {
-                    "resourceName": f"customers/{formatted_customer_id}/adGroupCriteria/{kw['ad_group_id'].strip()}~{kw['criterion_id'].strip()}",
-                    "cpcBidMicros": str(int(kw['cpc_bid_micros']))
+                    "resourceName": criterion_prefix + ad_group_id + "~" + criterion_id,
+                    "cpcBidMicros": bid
                 },
                 "updateMask": "cpcBidMicros"
             }
-            for kw in keywords
+            for ad_group_id, criterion_id, bid in bids
         ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
-
-        if not response.ok:
-            raise Exception(f"Error updating keyword bids: {response.status_code} {response.reason} - {response.text}")
-
-        updated = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        updated, _ = await _mutate_chunked(url, headers, operations, "updating keyword bids")
 
         if ctx:
-            ctx.info(f"Successfully updated {len(updated)} keyword bid(s).")
+            await ctx.info(f"Successfully updated {len(updated)} keyword bid(s).")
 
         return {
             "keywords_updated": len(updated),
@@ -680,12 +865,12 @@ def update_keyword_bid(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def set_keyword_status(
+async def set_keyword_status(
     customer_id: str,
     ad_group_id: str,
     criterion_ids: List[str],
@@ -713,46 +898,37 @@ def set_keyword_status(
         raise ValueError("criterion_ids must not be empty.")
 
     if ctx:
-        ctx.info(f"Setting {len(criterion_ids)} keyword(s) to {status} in ad group {ad_group_id}...")
+        await ctx.info(f"Setting {len(criterion_ids)} keyword(s) to {status} in ad group {ad_group_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroupCriteria:mutate"
 
+        criterion_prefix = f"customers/{formatted_customer_id}/adGroupCriteria/{ad_group_id.strip()}~"
+        resource_names = [criterion_prefix + cid.strip() for cid in criterion_ids]
         if status == 'REMOVED':
-            operations = [
-                {"remove": f"customers/{formatted_customer_id}/adGroupCriteria/{ad_group_id.strip()}~{cid.strip()}"}
-                for cid in criterion_ids
-            ]
+            operations = [{"remove": rn} for rn in resource_names]
         else:
             operations = [
                 {
                     "update": {
-                        "resourceName": f"customers/{formatted_customer_id}/adGroupCriteria/{ad_group_id.strip()}~{cid.strip()}",
+                        "resourceName": rn,
                         "status": status
                     },
                     "updateMask": "status"
                 }
-                for cid in criterion_ids
+                for rn in resource_names
             ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
-
-        if not response.ok:
-            raise Exception(f"Error updating keyword status: {response.status_code} {response.reason} - {response.text}")
-
-        updated = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        updated, _ = await _mutate_chunked(url, headers, operations, "updating keyword status")
 
         if ctx:
-            ctx.info(f"Successfully set {len(updated)} keyword(s) to {status}.")
+            await ctx.info(f"Successfully set {len(updated)} keyword(s) to {status}.")
 
         return {
             "keywords_updated": len(updated),
@@ -764,7 +940,7 @@ def set_keyword_status(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
@@ -783,7 +959,8 @@ def create_campaign(
 ) -> Dict[str, Any]:
     """Create a new campaign with a new daily budget.
 
-    Creates the budget first, then the campaign. Campaigns start PAUSED by default for safety.
+    Creates the budget and the campaign together in one atomic request, so a failed
+    campaign never leaves an orphaned budget. Campaigns start PAUSED by default for safety.
 
     Args:
         customer_id: The Google Ads customer ID (10 digits, no dashes)
@@ -804,15 +981,13 @@ def create_campaign(
     Returns:
         Resource names of the created budget and campaign
     """
-    valid_channel_types = {'SEARCH', 'DISPLAY', 'VIDEO', 'SHOPPING', 'PERFORMANCE_MAX'}
-    valid_bidding = {'MANUAL_CPC', 'TARGET_CPA', 'TARGET_ROAS', 'MAXIMIZE_CONVERSIONS', 'MAXIMIZE_CONVERSION_VALUE'}
     advertising_channel_type = advertising_channel_type.upper()
     bidding_strategy = bidding_strategy.upper()
 
-    if advertising_channel_type not in valid_channel_types:
-        raise ValueError(f"Invalid advertising_channel_type. Must be one of: {', '.join(sorted(valid_channel_types))}")
-    if bidding_strategy not in valid_bidding:
-        raise ValueError(f"Invalid bidding_strategy. Must be one of: {', '.join(sorted(valid_bidding))}")
+    if advertising_channel_type not in VALID_CHANNEL_TYPES:
+        raise ValueError(f"Invalid advertising_channel_type. Must be one of: {', '.join(sorted(VALID_CHANNEL_TYPES))}")
+    if bidding_strategy not in VALID_BIDDING_STRATEGIES:
+        raise ValueError(f"Invalid bidding_strategy. Must be one of: {', '.join(sorted(VALID_BIDDING_STRATEGIES))}")
     if bidding_strategy == 'TARGET_CPA' and not target_cpa_micros:
         raise ValueError("target_cpa_micros is required when bidding_strategy=TARGET_CPA")
     if bidding_strategy == 'TARGET_ROAS' and not target_roas:
@@ -827,41 +1002,27 @@ def create_campaign(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = get_headers_with_auto_token(customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
-        if ctx:
-            ctx.info(f"Creating budget (${round(daily_budget_micros / 1_000_000, 2)}/day)...")
-
-        budget_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignBudgets:mutate"
-        budget_response = _make_request(requests.post, budget_url, headers, json_body={
-            "operations": [{
-                "create": {
-                    "name": f"{name} Budget",
-                    "amountMicros": str(daily_budget_micros),
-                    "deliveryMethod": "STANDARD"
-                }
-            }]
-        })
-
-        if not budget_response.ok:
-            raise Exception(f"Error creating budget: {budget_response.status_code} {budget_response.reason} - {budget_response.text}")
-
-        budget_resource = budget_response.json().get('results', [{}])[0].get('resourceName', '')
-        if not budget_resource:
-            raise Exception("Budget created but resource name was not returned.")
-
         if ctx:
-            ctx.info(f"Budget created: {budget_resource}. Creating campaign...")
+            ctx.info(f"Creating budget (${round(daily_budget_micros / 1_000_000, 2)}/day) and campaign...")
+
+        # The campaign references the new budget by its temporary (negative)
+        # resource name, which the API resolves within the same request
+        temp_budget = f"customers/{formatted_customer_id}/campaignBudgets/-1"
+        budget_create = {
+            "resourceName": temp_budget,
+            "name": f"{name} Budget",
+            "amountMicros": str(daily_budget_micros),
+            "deliveryMethod": "STANDARD"
+        }
 
         campaign_create = {
             "name": name,
             "status": "PAUSED" if start_paused else "ENABLED",
             "advertisingChannelType": advertising_channel_type,
-            "campaignBudget": budget_resource,
+            "campaignBudget": temp_budget,
             "networkSettings": {
                 "targetGoogleSearch": True,
                 "targetSearchNetwork": True,
@@ -870,24 +1031,23 @@ def create_campaign(
             }
         }
 
-        if bidding_strategy == 'MANUAL_CPC':
-            campaign_create['manualCpc'] = {"enhancedCpcEnabled": False}
-        elif bidding_strategy == 'TARGET_CPA':
-            campaign_create['targetCpa'] = {"targetCpaMicros": str(target_cpa_micros)}
-        elif bidding_strategy == 'TARGET_ROAS':
-            campaign_create['targetRoas'] = {"targetRoas": target_roas}
-        elif bidding_strategy == 'MAXIMIZE_CONVERSIONS':
-            campaign_create['maximizeConversions'] = {}
-        elif bidding_strategy == 'MAXIMIZE_CONVERSION_VALUE':
-            campaign_create['maximizeConversionValue'] = {}
+        field, value = _bidding_strategy_field(bidding_strategy, target_cpa_micros, target_roas)
+        campaign_create[field] = value
 
-        campaign_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaigns:mutate"
-        campaign_response = _make_request(requests.post, campaign_url, headers, json_body={"operations": [{"create": campaign_create}]})
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:mutate"
+        response = _make_request(_session.post, url, headers, json_body={
+            "mutateOperations": [
+                {"campaignBudgetOperation": {"create": budget_create}},
+                {"campaignOperation": {"create": campaign_create}}
+            ]
+        })
 
-        if not campaign_response.ok:
-            raise Exception(f"Error creating campaign: {campaign_response.status_code} {campaign_response.reason} - {campaign_response.text}")
+        if not response.ok:
+            raise Exception(f"Error creating campaign: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        campaign_resource = campaign_response.json().get('results', [{}])[0].get('resourceName', '')
+        results = _json_loads(response).get('mutateOperationResponses', [{}, {}])
+        budget_resource = results[0].get('campaignBudgetResult', {}).get('resourceName', '')
+        campaign_resource = results[-1].get('campaignResult', {}).get('resourceName', '')
 
         if ctx:
             ctx.info(f"Campaign created: {campaign_resource}")
@@ -941,14 +1101,11 @@ def create_ad_group(
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = get_headers_with_auto_token(customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroups:mutate"
-        response = _make_request(requests.post, url, headers, json_body={
+        response = _make_request(_session.post, url, headers, json_body={
             "operations": [{
                 "create": {
                     "name": name,
@@ -960,9 +1117,9 @@ def create_ad_group(
         })
 
         if not response.ok:
-            raise Exception(f"Error creating ad group: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error creating ad group: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        resource_name = response.json().get('results', [{}])[0].get('resourceName', '')
+        resource_name = _json_loads(response).get('results', [{}])[0].get('resourceName', '')
 
         if ctx:
             ctx.info(f"Ad group created: {resource_name}")
@@ -983,7 +1140,7 @@ def create_ad_group(
 
 
 @mcp.tool
-def set_ad_status(
+async def set_ad_status(
     customer_id: str,
     ads: List[Dict[str, str]],
     status: str,
@@ -1008,44 +1165,39 @@ def set_ad_status(
         raise ValueError(f"Invalid status '{status}'. Must be ENABLED or PAUSED.")
     if not ads:
         raise ValueError("ads list must not be empty.")
+    ad_keys = []
     for ad in ads:
         if 'ad_group_id' not in ad or 'ad_id' not in ad:
             raise ValueError("Each ad dict must have 'ad_group_id' and 'ad_id'.")
+        ad_keys.append(f"{ad['ad_group_id'].strip()}~{ad['ad_id'].strip()}")
 
     if ctx:
-        ctx.info(f"Setting {len(ads)} ad(s) to {status} for customer {customer_id}...")
+        await ctx.info(f"Setting {len(ads)} ad(s) to {status} for customer {customer_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/adGroupAds:mutate"
+        ad_prefix = f"customers/{formatted_customer_id}/adGroupAds/"
         operations = [
             {
                 "update": {
-                    "resourceName": f"customers/{formatted_customer_id}/adGroupAds/{ad['ad_group_id'].strip()}~{ad['ad_id'].strip()}",
+                    "resourceName": ad_prefix + key,
                     "status": status
                 },
                 "updateMask": "status"
             }
-            for ad in ads
+            for key in ad_keys
         ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
-
-        if not response.ok:
-            raise Exception(f"Error updating ad status: {response.status_code} {response.reason} - {response.text}")
-
-        updated = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        updated, _ = await _mutate_chunked(url, headers, operations, "updating ad status")
 
         if ctx:
-            ctx.info(f"Successfully set {len(updated)} ad(s) to {status}.")
+            await ctx.info(f"Successfully set {len(updated)} ad(s) to {status}.")
 
         return {
             "ads_updated": len(updated),
@@ -1056,12 +1208,12 @@ def set_ad_status(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_sitelinks(
+async def add_sitelinks(
     customer_id: str,
     campaign_id: str,
     sitelinks: List[Dict[str, str]],
@@ -1070,7 +1222,8 @@ def add_sitelinks(
 ) -> Dict[str, Any]:
     """Add sitelink assets to a campaign.
 
-    Creates each sitelink as an asset then links it to the campaign.
+    Creates each sitelink as an asset and links it to the campaign in a
+    single request.
 
     Args:
         customer_id: The Google Ads customer ID (10 digits, no dashes)
@@ -1088,74 +1241,50 @@ def add_sitelinks(
     """
     if not sitelinks:
         raise ValueError("sitelinks list must not be empty.")
-    for sl in sitelinks:
-        if 'link_text' not in sl or 'final_url' not in sl:
-            raise ValueError("Each sitelink must have 'link_text' and 'final_url'.")
-        if len(sl['link_text']) > 25:
-            raise ValueError(f"link_text too long (max 25 chars): '{sl['link_text']}'")
-        if sl.get('description1') and len(sl['description1']) > 35:
-            raise ValueError(f"description1 too long (max 35 chars): '{sl['description1']}'")
-        if sl.get('description2') and len(sl['description2']) > 35:
-            raise ValueError(f"description2 too long (max 35 chars): '{sl['description2']}'")
+    if any('link_text' not in sl or 'final_url' not in sl for sl in sitelinks):
+        raise ValueError("Each sitelink must have 'link_text' and 'final_url'.")
+    too_long = [
+        f"{field} too long (max {max_len} chars): '{value}'"
+        for sl in sitelinks
+        for field, max_len in _SITELINK_LIMITS
+        if (value := sl.get(field)) and len(value) > max_len
+    ]
+    if too_long:
+        raise ValueError("; ".join(too_long))
 
     if ctx:
-        ctx.info(f"Adding {len(sitelinks)} sitelink(s) to campaign {campaign_id}...")
+        await ctx.info(f"Adding {len(sitelinks)} sitelink(s) to campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
-        asset_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/assets:mutate"
-        asset_operations = []
+        assets = []
         for sl in sitelinks:
             sitelink_asset = {"linkText": sl['link_text']}
             if sl.get('description1'):
                 sitelink_asset['description1'] = sl['description1']
             if sl.get('description2'):
                 sitelink_asset['description2'] = sl['description2']
-            asset_operations.append({
-                "create": {
-                    "name": f"Sitelink: {sl['link_text']}",
-                    "finalUrls": [sl['final_url']],
-                    "sitelinkAsset": sitelink_asset,
-                }
+            assets.append({
+                "name": f"Sitelink: {sl['link_text']}",
+                "finalUrls": [sl['final_url']],
+                "sitelinkAsset": sitelink_asset,
             })
 
-        asset_response = _make_request(requests.post, asset_url, headers, json_body={"operations": asset_operations})
-        if not asset_response.ok:
-            raise Exception(f"Error creating sitelink assets: {asset_response.status_code} {asset_response.reason} - {asset_response.text}")
-
-        asset_rns = [r.get('resourceName', '') for r in asset_response.json().get('results', [])]
-
-        if ctx:
-            ctx.info(f"Created {len(asset_rns)} asset(s). Linking to campaign...")
-
-        link_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignAssets:mutate"
-        link_operations = [
-            {
-                "create": {
-                    "asset": rn,
-                    "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
-                    "fieldType": "SITELINK"
-                }
-            }
-            for rn in asset_rns
-        ]
-
-        link_response = _make_request(requests.post, link_url, headers, json_body={"operations": link_operations})
-        if not link_response.ok:
-            raise Exception(f"Error linking sitelinks to campaign: {link_response.status_code} {link_response.reason} - {link_response.text}")
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:mutate"
+        operations = _campaign_asset_mutate_operations(formatted_customer_id, campaign_id, assets, "SITELINK")
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"mutateOperations": operations})
+        if not response.ok:
+            raise Exception(f"Error adding sitelinks: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        link_rns = [r.get('resourceName', '') for r in link_response.json().get('results', [])]
+        asset_rns, link_rns = _campaign_asset_results(_json_loads(response))
 
         if ctx:
-            ctx.info(f"Successfully added {len(link_rns)} sitelink(s) to campaign.")
+            await ctx.info(f"Successfully added {len(link_rns)} sitelink(s) to campaign.")
 
         return {
             "sitelinks_added": len(link_rns),
@@ -1167,12 +1296,12 @@ def add_sitelinks(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_callouts(
+async def add_callouts(
     customer_id: str,
     campaign_id: str,
     callout_texts: List[str],
@@ -1181,7 +1310,8 @@ def add_callouts(
 ) -> Dict[str, Any]:
     """Add callout assets to a campaign.
 
-    Creates each callout as an asset then links it to the campaign.
+    Creates each callout as an asset and links it to the campaign in a
+    single request.
 
     Args:
         customer_id: The Google Ads customer ID (10 digits, no dashes)
@@ -1195,60 +1325,32 @@ def add_callouts(
     """
     if not callout_texts:
         raise ValueError("callout_texts must not be empty.")
-    for text in callout_texts:
-        if len(text) > 25:
-            raise ValueError(f"Callout text too long (max 25 chars): '{text}' ({len(text)} chars)")
+    too_long = next((text for text in callout_texts if len(text) > 25), None)
+    if too_long is not None:
+        raise ValueError(f"Callout text too long (max 25 chars): '{too_long}' ({len(too_long)} chars)")
 
     if ctx:
-        ctx.info(f"Adding {len(callout_texts)} callout(s) to campaign {campaign_id}...")
+        await ctx.info(f"Adding {len(callout_texts)} callout(s) to campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
-        asset_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/assets:mutate"
-        asset_response = _make_request(requests.post, asset_url, headers, json_body={
-            "operations": [
-                {"create": {"name": f"Callout: {text}", "calloutAsset": {"calloutText": text}}}
-                for text in callout_texts
-            ]
-        })
-
-        if not asset_response.ok:
-            raise Exception(f"Error creating callout assets: {asset_response.status_code} {asset_response.reason} - {asset_response.text}")
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:mutate"
+        assets = [{"name": f"Callout: {text}", "calloutAsset": {"calloutText": text}} for text in callout_texts]
+        operations = _campaign_asset_mutate_operations(formatted_customer_id, campaign_id, assets, "CALLOUT")
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"mutateOperations": operations})
 
-        asset_rns = [r.get('resourceName', '') for r in asset_response.json().get('results', [])]
-
-        if ctx:
-            ctx.info(f"Created {len(asset_rns)} callout asset(s). Linking to campaign...")
-
-        link_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignAssets:mutate"
-        link_response = _make_request(requests.post, link_url, headers, json_body={
-            "operations": [
-                {
-                    "create": {
-                        "asset": rn,
-                        "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
-                        "fieldType": "CALLOUT"
-                    }
-                }
-                for rn in asset_rns
-            ]
-        })
-
-        if not link_response.ok:
-            raise Exception(f"Error linking callouts to campaign: {link_response.status_code} {link_response.reason} - {link_response.text}")
+        if not response.ok:
+            raise Exception(f"Error adding callouts: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        link_rns = [r.get('resourceName', '') for r in link_response.json().get('results', [])]
+        asset_rns, link_rns = _campaign_asset_results(_json_loads(response))
 
         if ctx:
-            ctx.info(f"Successfully added {len(link_rns)} callout(s) to campaign.")
+            await ctx.info(f"Successfully added {len(link_rns)} callout(s) to campaign.")
 
         return {
             "callouts_added": len(link_rns),
@@ -1260,12 +1362,12 @@ def add_callouts(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def set_bid_adjustment(
+async def set_bid_adjustment(
     customer_id: str,
     campaign_id: str,
     adjustment_type: str,
@@ -1292,84 +1394,57 @@ def set_bid_adjustment(
     Returns:
         Resource name of the created or updated campaign criterion
     """
-    adjustment_type = adjustment_type.upper()
-    if adjustment_type not in ('DEVICE', 'LOCATION'):
-        raise ValueError("adjustment_type must be 'DEVICE' or 'LOCATION'.")
-    if bid_modifier < 0.0 or bid_modifier > 10.0:
-        raise ValueError("bid_modifier must be between 0.0 and 10.0.")
-    if adjustment_type == 'DEVICE':
-        device_type = device_type.upper()
-        if device_type not in ('MOBILE', 'TABLET', 'DESKTOP'):
-            raise ValueError("device_type must be MOBILE, TABLET, or DESKTOP when adjustment_type=DEVICE.")
-    if adjustment_type == 'LOCATION' and not geo_target_id:
-        raise ValueError("geo_target_id is required when adjustment_type=LOCATION.")
+    adjustment_type, device_type = _validate_bid_adjustment(adjustment_type, bid_modifier, device_type, geo_target_id)
 
     if ctx:
-        ctx.info(f"Setting {adjustment_type} bid adjustment ({bid_modifier}x) on campaign {campaign_id}...")
+        await ctx.info(f"Setting {adjustment_type} bid adjustment ({bid_modifier}x) on campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
         formatted_customer_id = format_customer_id(customer_id)
-        mgr = format_customer_id(manager_id) if manager_id else ""
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
+        campaign_id = campaign_id.strip()
+        campaign = f"customers/{formatted_customer_id}/campaigns/{campaign_id}"
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
 
         if adjustment_type == 'DEVICE':
-            query = (
-                f"SELECT campaign_criterion.criterion_id, campaign_criterion.device.type "
-                f"FROM campaign_criterion "
-                f"WHERE campaign.id = {campaign_id.strip()} "
-                f"AND campaign_criterion.type = 'DEVICE' "
-                f"AND campaign_criterion.device.type = '{device_type}'"
-            )
-            result = execute_gaql(formatted_customer_id, query, mgr)
-            rows = result.get('results', [])
-
-            headers = get_headers_with_auto_token()
-            if manager_id:
-                headers['login-customer-id'] = mgr
-
-            if rows:
-                criterion_id = rows[0].get('campaignCriterion', {}).get('criterionId', '')
-                operation = {
-                    "update": {
-                        "resourceName": f"customers/{formatted_customer_id}/campaignCriteria/{campaign_id.strip()}~{criterion_id}",
-                        "bidModifier": bid_modifier
-                    },
-                    "updateMask": "bidModifier"
-                }
-            else:
+            # Device criterion IDs are fixed, so the resource name is known
+            # without a lookup; create it only if the campaign lacks one
+            criterion = f"customers/{formatted_customer_id}/campaignCriteria/{campaign_id}~{_DEVICE_CRITERION_IDS[device_type]}"
+            operation = {
+                "update": {"resourceName": criterion, "bidModifier": bid_modifier},
+                "updateMask": "bidModifier"
+            }
+            response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": [operation]})
+            if not response.ok and _resource_not_found(response):
                 operation = {
                     "create": {
-                        "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
+                        "campaign": campaign,
                         "device": {"type": device_type},
                         "bidModifier": bid_modifier
                     }
                 }
+                response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": [operation]})
         else:  # LOCATION
-            headers = get_headers_with_auto_token()
-            if manager_id:
-                headers['login-customer-id'] = mgr
-
             operation = {
                 "create": {
-                    "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
+                    "campaign": campaign,
                     "location": {"geoTargetConstant": f"geoTargetConstants/{geo_target_id}"},
                     "bidModifier": bid_modifier
                 }
             }
-
-        response = _make_request(requests.post, url, headers, json_body={"operations": [operation]})
+            response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": [operation]})
 
         if not response.ok:
-            raise Exception(f"Error setting bid adjustment: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error setting bid adjustment: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        resource_name = response.json().get('results', [{}])[0].get('resourceName', '')
+        resource_name = _json_loads(response).get('results', [{}])[0].get('resourceName', '')
         pct = round((bid_modifier - 1) * 100, 1)
 
         if ctx:
-            ctx.info(f"Bid adjustment set: {resource_name} ({pct:+.1f}%)")
+            await ctx.info(f"Bid adjustment set: {resource_name} ({pct:+.1f}%)")
 
         result = {
             "adjustment_set": resource_name,
@@ -1388,12 +1463,136 @@ def set_bid_adjustment(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
+        raise
+
+
+@mcp.tool
+async def set_bid_adjustments(
+    customer_id: str,
+    campaign_id: str,
+    adjustments: List[Dict[str, Any]],
+    manager_id: str = "",
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Set several device and/or location bid adjustments on a campaign in one request.
+
+    Use this instead of repeated set_bid_adjustment calls, e.g. to set
+    MOBILE, TABLET and DESKTOP modifiers together.
+
+    Args:
+        customer_id: The Google Ads customer ID (10 digits, no dashes)
+        campaign_id: The campaign ID to set the adjustments on
+        adjustments: List of adjustment dicts. Each must have:
+            - 'adjustment_type': 'DEVICE' or 'LOCATION'
+            - 'bid_modifier': Multiplier, 1.0 = no change, 1.2 = +20%, 0.0 = exclude (device only)
+            And one of:
+            - 'device_type': 'MOBILE', 'TABLET' or 'DESKTOP' (DEVICE)
+            - 'geo_target_id': Geo target constant ID, e.g. 2840=US (LOCATION)
+        manager_id: Manager ID if the account is accessed through an MCC
+
+    Returns:
+        Resource names of the created or updated campaign criteria
+    """
+    if not adjustments:
+        raise ValueError("adjustments must not be empty.")
+    items = []
+    for adj in adjustments:
+        if 'adjustment_type' not in adj or 'bid_modifier' not in adj:
+            raise ValueError("Each adjustment must have 'adjustment_type' and 'bid_modifier'.")
+        bid_modifier = float(adj['bid_modifier'])
+        geo_target_id = int(adj.get('geo_target_id', 0))
+        adjustment_type, device_type = _validate_bid_adjustment(
+            adj['adjustment_type'], bid_modifier, adj.get('device_type', ''), geo_target_id)
+        items.append((adjustment_type, device_type, geo_target_id, bid_modifier))
+
+    if ctx:
+        await ctx.info(f"Setting {len(items)} bid adjustment(s) on campaign {campaign_id}...")
+
+    if not GOOGLE_ADS_DEVELOPER_TOKEN:
+        raise ValueError("Google Ads Developer Token is not set in environment variables.")
+
+    try:
+        formatted_customer_id = format_customer_id(customer_id)
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
+        campaign_id = campaign_id.strip()
+        campaign = f"customers/{formatted_customer_id}/campaigns/{campaign_id}"
+        criterion_prefix = f"customers/{formatted_customer_id}/campaignCriteria/{campaign_id}~"
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
+
+        def build_operations(missing_devices=frozenset()):
+            operations = []
+            for adjustment_type, device_type, geo_target_id, bid_modifier in items:
+                if adjustment_type == 'LOCATION':
+                    operations.append({"create": {
+                        "campaign": campaign,
+                        "location": {"geoTargetConstant": f"geoTargetConstants/{geo_target_id}"},
+                        "bidModifier": bid_modifier
+                    }})
+                elif device_type in missing_devices:
+                    operations.append({"create": {
+                        "campaign": campaign,
+                        "device": {"type": device_type},
+                        "bidModifier": bid_modifier
+                    }})
+                else:
+                    # Device criterion IDs are fixed, so no lookup is needed
+                    operations.append({
+                        "update": {
+                            "resourceName": criterion_prefix + str(_DEVICE_CRITERION_IDS[device_type]),
+                            "bidModifier": bid_modifier
+                        },
+                        "updateMask": "bidModifier"
+                    })
+            return operations
+
+        operations = build_operations()
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": operations})
+        not_found = None if response.ok else _not_found_operations(response)
+        # Only missing device criteria (the update operations) can be fixed
+        # by creating them; anything else keeps the original error
+        if not_found and all(i is not None and i < len(operations) and 'update' in operations[i] for i in not_found):
+            # Find which device criteria exist in a single query, and check
+            # the campaign itself exists, since updating a criterion of an
+            # unknown campaign fails the same way
+            mgr = format_customer_id(manager_id) if manager_id else ""
+            device_query = (
+                f"SELECT campaign_criterion.device.type FROM campaign_criterion "
+                f"WHERE campaign.id = {campaign_id} AND campaign_criterion.type = 'DEVICE'"
+            )
+            campaign_query = f"SELECT campaign.id FROM campaign WHERE campaign.id = {campaign_id}"
+            devices, campaigns = await asyncio.gather(
+                asyncio.to_thread(execute_gaql, formatted_customer_id, device_query, mgr),
+                asyncio.to_thread(execute_gaql, formatted_customer_id, campaign_query, mgr),
+            )
+            if campaigns.get('results'):
+                existing = {r.get('campaignCriterion', {}).get('device', {}).get('type') for r in devices.get('results', [])}
+                missing = frozenset(_DEVICE_CRITERION_IDS) - existing
+                response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": build_operations(missing)})
+
+        if not response.ok:
+            raise Exception(f"Error setting bid adjustments: {response.status_code} {response.reason} - {_error_body(response)}")
+
+        resource_names = [r.get('resourceName', '') for r in _json_loads(response).get('results', [])]
+
+        if ctx:
+            await ctx.info(f"Set {len(resource_names)} bid adjustment(s).")
+
+        return {
+            "adjustments_set": len(resource_names),
+            "resource_names": resource_names,
+            "campaign_id": campaign_id,
+            "customer_id": formatted_customer_id
+        }
+
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def update_bidding_strategy(
+async def update_bidding_strategy(
     customer_id: str,
     campaign_id: str,
     bidding_strategy: str,
@@ -1418,59 +1617,42 @@ def update_bidding_strategy(
     Returns:
         Updated campaign resource name and new bidding strategy
     """
-    valid = {'MANUAL_CPC', 'TARGET_CPA', 'TARGET_ROAS', 'MAXIMIZE_CONVERSIONS', 'MAXIMIZE_CONVERSION_VALUE'}
     bidding_strategy = bidding_strategy.upper()
-    if bidding_strategy not in valid:
-        raise ValueError(f"Invalid bidding_strategy. Must be one of: {', '.join(sorted(valid))}")
+    if bidding_strategy not in VALID_BIDDING_STRATEGIES:
+        raise ValueError(f"Invalid bidding_strategy. Must be one of: {', '.join(sorted(VALID_BIDDING_STRATEGIES))}")
     if bidding_strategy == 'TARGET_CPA' and not target_cpa_micros:
         raise ValueError("target_cpa_micros is required when bidding_strategy=TARGET_CPA")
     if bidding_strategy == 'TARGET_ROAS' and not target_roas:
         raise ValueError("target_roas is required when bidding_strategy=TARGET_ROAS")
 
     if ctx:
-        ctx.info(f"Updating bidding strategy for campaign {campaign_id} to {bidding_strategy}...")
+        await ctx.info(f"Updating bidding strategy for campaign {campaign_id} to {bidding_strategy}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         resource_name = f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}"
         update_body = {"resourceName": resource_name}
 
-        if bidding_strategy == 'MANUAL_CPC':
-            update_body['manualCpc'] = {"enhancedCpcEnabled": False}
-            update_mask = "manualCpc"
-        elif bidding_strategy == 'TARGET_CPA':
-            update_body['targetCpa'] = {"targetCpaMicros": str(target_cpa_micros)}
-            update_mask = "targetCpa"
-        elif bidding_strategy == 'TARGET_ROAS':
-            update_body['targetRoas'] = {"targetRoas": target_roas}
-            update_mask = "targetRoas"
-        elif bidding_strategy == 'MAXIMIZE_CONVERSIONS':
-            update_body['maximizeConversions'] = {}
-            update_mask = "maximizeConversions"
-        elif bidding_strategy == 'MAXIMIZE_CONVERSION_VALUE':
-            update_body['maximizeConversionValue'] = {}
-            update_mask = "maximizeConversionValue"
+        update_mask, strategy = _bidding_strategy_field(bidding_strategy, target_cpa_micros, target_roas)
+        update_body[update_mask] = strategy
 
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaigns:mutate"
-        response = _make_request(requests.post, url, headers, json_body={
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={
             "operations": [{"update": update_body, "updateMask": update_mask}]
         })
 
         if not response.ok:
-            raise Exception(f"Error updating bidding strategy: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error updating bidding strategy: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        updated_rn = response.json().get('results', [{}])[0].get('resourceName', resource_name)
+        updated_rn = _json_loads(response).get('results', [{}])[0].get('resourceName', resource_name)
 
         if ctx:
-            ctx.info(f"Bidding strategy updated to {bidding_strategy}.")
+            await ctx.info(f"Bidding strategy updated to {bidding_strategy}.")
 
         result = {
             "campaign_updated": updated_rn,
@@ -1488,12 +1670,12 @@ def update_bidding_strategy(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_location_targeting(
+async def add_location_targeting(
     customer_id: str,
     campaign_id: str,
     geo_target_ids: List[int],
@@ -1524,23 +1706,21 @@ def add_location_targeting(
 
     action = "Excluding" if negative else "Targeting"
     if ctx:
-        ctx.info(f"{action} {len(geo_target_ids)} location(s) for campaign {campaign_id}...")
+        await ctx.info(f"{action} {len(geo_target_ids)} location(s) for campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
+        campaign = f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}"
         operations = [
             {
                 "create": {
-                    "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
+                    "campaign": campaign,
                     "negative": negative,
                     "location": {"geoTargetConstant": f"geoTargetConstants/{gid}"}
                 }
@@ -1548,15 +1728,10 @@ def add_location_targeting(
             for gid in geo_target_ids
         ]
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
-
-        if not response.ok:
-            raise Exception(f"Error adding location targeting: {response.status_code} {response.reason} - {response.text}")
-
-        created = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        created, _ = await _mutate_chunked(url, headers, operations, "adding location targeting")
 
         if ctx:
-            ctx.info(f"Successfully added {len(created)} location target(s).")
+            await ctx.info(f"Successfully added {len(created)} location target(s).")
 
         return {
             "locations_added": len(created),
@@ -1569,12 +1744,12 @@ def add_location_targeting(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def set_ad_schedule(
+async def set_ad_schedule(
     customer_id: str,
     campaign_id: str,
     schedules: List[Dict[str, Any]],
@@ -1604,60 +1779,68 @@ def set_ad_schedule(
     Returns:
         Summary of schedule slots created
     """
-    valid_days = {'MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY'}
-
     if not schedules:
         raise ValueError("schedules list must not be empty.")
 
+    # Validate and normalize in one pass: (day, start_hour, start_minute,
+    # end_hour, end_minute, bid_modifier or None)
+    slots = []
     for s in schedules:
         if 'day' not in s or 'start_hour' not in s or 'end_hour' not in s:
             raise ValueError("Each schedule must have 'day', 'start_hour', and 'end_hour'.")
-        if s['day'].upper() not in valid_days:
-            raise ValueError(f"Invalid day '{s['day']}'. Must be one of: {', '.join(sorted(valid_days))}")
-        if not (0 <= int(s['start_hour']) <= 23):
+        day = s['day'].upper()
+        if day not in VALID_DAYS:
+            raise ValueError(f"Invalid day '{s['day']}'. Must be one of: {', '.join(sorted(VALID_DAYS))}")
+        start_hour, end_hour = int(s['start_hour']), int(s['end_hour'])
+        if not (0 <= start_hour <= 23):
             raise ValueError("start_hour must be 0-23.")
-        if not (1 <= int(s['end_hour']) <= 24):
+        if not (1 <= end_hour <= 24):
             raise ValueError("end_hour must be 1-24.")
+        start_minute = s.get('start_minute', 'ZERO').upper()
+        end_minute = s.get('end_minute', 'ZERO').upper()
+        for field, minute in (('start_minute', start_minute), ('end_minute', end_minute)):
+            if minute not in VALID_MINUTES:
+                raise ValueError(f"Invalid {field} '{s[field]}'. Must be one of: ZERO, FIFTEEN, THIRTY, FORTY_FIVE")
+        bid_modifier = float(s['bid_modifier']) if 'bid_modifier' in s else None
+        slots.append((day, start_hour, start_minute, end_hour, end_minute, bid_modifier))
 
     if ctx:
-        ctx.info(f"Setting {len(schedules)} ad schedule slot(s) for campaign {campaign_id}...")
+        await ctx.info(f"Setting {len(schedules)} ad schedule slot(s) for campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
+        campaign = f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}"
         operations = []
-        for s in schedules:
+        for day, start_hour, start_minute, end_hour, end_minute, bid_modifier in slots:
             slot = {
-                "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
+                "campaign": campaign,
                 "adSchedule": {
-                    "dayOfWeek": s['day'].upper(),
-                    "startHour": int(s['start_hour']),
-                    "startMinute": s.get('start_minute', 'ZERO').upper(),
-                    "endHour": int(s['end_hour']),
-                    "endMinute": s.get('end_minute', 'ZERO').upper(),
+                    "dayOfWeek": day,
+                    "startHour": start_hour,
+                    "startMinute": start_minute,
+                    "endHour": end_hour,
+                    "endMinute": end_minute,
                 }
             }
-            if 'bid_modifier' in s:
-                slot['bidModifier'] = float(s['bid_modifier'])
+            if bid_modifier is not None:
+                slot['bidModifier'] = bid_modifier
             operations.append({"create": slot})
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": operations})
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": operations})
 
         if not response.ok:
-            raise Exception(f"Error setting ad schedule: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error setting ad schedule: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        created = [r.get('resourceName', '') for r in response.json().get('results', [])]
+        created = [r.get('resourceName', '') for r in _json_loads(response).get('results', [])]
 
         if ctx:
-            ctx.info(f"Successfully created {len(created)} ad schedule slot(s).")
+            await ctx.info(f"Successfully created {len(created)} ad schedule slot(s).")
 
         return {
             "slots_created": len(created),
@@ -1668,12 +1851,12 @@ def set_ad_schedule(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_demographic_adjustment(
+async def add_demographic_adjustment(
     customer_id: str,
     campaign_id: str,
     demographic_type: str,
@@ -1702,82 +1885,61 @@ def add_demographic_adjustment(
     if demographic_type not in ('AGE', 'GENDER'):
         raise ValueError("demographic_type must be 'AGE' or 'GENDER'.")
 
-    valid_age = {
-        'AGE_RANGE_18_24', 'AGE_RANGE_25_34', 'AGE_RANGE_35_44',
-        'AGE_RANGE_45_54', 'AGE_RANGE_55_64', 'AGE_RANGE_65_UP', 'AGE_RANGE_UNDETERMINED'
-    }
-    valid_gender = {'MALE', 'FEMALE', 'UNDETERMINED'}
     value = value.upper()
 
-    if demographic_type == 'AGE' and value not in valid_age:
-        raise ValueError(f"Invalid age value '{value}'. Must be one of: {', '.join(sorted(valid_age))}")
-    if demographic_type == 'GENDER' and value not in valid_gender:
-        raise ValueError(f"Invalid gender value '{value}'. Must be one of: {', '.join(sorted(valid_gender))}")
+    if demographic_type == 'AGE' and value not in VALID_AGE_RANGES:
+        raise ValueError(f"Invalid age value '{value}'. Must be one of: {', '.join(sorted(VALID_AGE_RANGES))}")
+    if demographic_type == 'GENDER' and value not in VALID_GENDERS:
+        raise ValueError(f"Invalid gender value '{value}'. Must be one of: {', '.join(sorted(VALID_GENDERS))}")
     if bid_modifier < 0.0 or bid_modifier > 10.0:
         raise ValueError("bid_modifier must be between 0.0 and 10.0.")
 
     if ctx:
-        ctx.info(f"Setting {demographic_type} ({value}) bid adjustment ({bid_modifier}x) on campaign {campaign_id}...")
+        await ctx.info(f"Setting {demographic_type} ({value}) bid adjustment ({bid_modifier}x) on campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
         formatted_customer_id = format_customer_id(customer_id)
-        mgr = format_customer_id(manager_id) if manager_id else ""
-
-        criterion_type_filter = "'AGE_RANGE'" if demographic_type == 'AGE' else "'GENDER'"
-        query = (
-            f"SELECT campaign_criterion.criterion_id, campaign_criterion.type "
-            f"FROM campaign_criterion "
-            f"WHERE campaign.id = {campaign_id.strip()} "
-            f"AND campaign_criterion.type = {criterion_type_filter}"
-        )
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
+        campaign_id = campaign_id.strip()
 
+        # Demographic criterion IDs are fixed, so update the criterion by its
+        # known resource name and create it only if the campaign lacks one
         if demographic_type == 'AGE':
-            query += f" AND campaign_criterion.age_range.type = '{value}'"
+            criterion_id = _AGE_RANGE_CRITERION_IDS[value]
         else:
-            query += f" AND campaign_criterion.gender.type = '{value}'"
-
-        result = execute_gaql(formatted_customer_id, query, mgr)
-        rows = result.get('results', [])
-
-        headers = get_headers_with_auto_token()
-        if manager_id:
-            headers['login-customer-id'] = mgr
-
-        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignCriteria:mutate"
+            criterion_id = _GENDER_CRITERION_IDS[value]
+        operation = {
+            "update": {
+                "resourceName": f"customers/{formatted_customer_id}/campaignCriteria/{campaign_id}~{criterion_id}",
+                "bidModifier": bid_modifier
+            },
+            "updateMask": "bidModifier"
+        }
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": [operation]})
 
-        if rows:
-            criterion_id = rows[0].get('campaignCriterion', {}).get('criterionId', '')
-            operation = {
-                "update": {
-                    "resourceName": f"customers/{formatted_customer_id}/campaignCriteria/{campaign_id.strip()}~{criterion_id}",
-                    "bidModifier": bid_modifier
-                },
-                "updateMask": "bidModifier"
-            }
-        else:
+        if not response.ok and _resource_not_found(response):
             criterion_body = {
-                "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
+                "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id}",
                 "bidModifier": bid_modifier
             }
             if demographic_type == 'AGE':
                 criterion_body['ageRange'] = {"type": value}
             else:
                 criterion_body['gender'] = {"type": value}
-            operation = {"create": criterion_body}
-
-        response = _make_request(requests.post, url, headers, json_body={"operations": [operation]})
+            response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": [{"create": criterion_body}]})
 
         if not response.ok:
-            raise Exception(f"Error setting demographic adjustment: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error setting demographic adjustment: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        resource_name = response.json().get('results', [{}])[0].get('resourceName', '')
+        resource_name = _json_loads(response).get('results', [{}])[0].get('resourceName', '')
         pct = round((bid_modifier - 1) * 100, 1)
 
         if ctx:
-            ctx.info(f"Demographic adjustment set: {resource_name} ({pct:+.1f}%)")
+            await ctx.info(f"Demographic adjustment set: {resource_name} ({pct:+.1f}%)")
 
         return {
             "adjustment_set": resource_name,
@@ -1791,12 +1953,12 @@ def add_demographic_adjustment(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_structured_snippets(
+async def add_structured_snippets(
     customer_id: str,
     campaign_id: str,
     snippets: List[Dict[str, Any]],
@@ -1830,63 +1992,33 @@ def add_structured_snippets(
                 raise ValueError(f"Snippet value too long (max 25 chars): '{v}'")
 
     if ctx:
-        ctx.info(f"Adding {len(snippets)} structured snippet(s) to campaign {campaign_id}...")
+        await ctx.info(f"Adding {len(snippets)} structured snippet(s) to campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
-        asset_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/assets:mutate"
-        asset_response = _make_request(requests.post, asset_url, headers, json_body={
-            "operations": [
-                {
-                    "create": {
-                        "name": f"Snippet: {s['header']}",
-                        "structuredSnippetAsset": {
-                            "header": s['header'],
-                            "values": s['values']
-                        }
-                    }
-                }
-                for s in snippets
-            ]
-        })
-
-        if not asset_response.ok:
-            raise Exception(f"Error creating snippet assets: {asset_response.status_code} {asset_response.reason} - {asset_response.text}")
-
-        asset_rns = [r.get('resourceName', '') for r in asset_response.json().get('results', [])]
-
-        if ctx:
-            ctx.info(f"Created {len(asset_rns)} snippet asset(s). Linking to campaign...")
-
-        link_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignAssets:mutate"
-        link_response = _make_request(requests.post, link_url, headers, json_body={
-            "operations": [
-                {
-                    "create": {
-                        "asset": rn,
-                        "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
-                        "fieldType": "STRUCTURED_SNIPPET"
-                    }
-                }
-                for rn in asset_rns
-            ]
-        })
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:mutate"
+        assets = [
+            {
+                "name": f"Snippet: {s['header']}",
+                "structuredSnippetAsset": {"header": s['header'], "values": s['values']}
+            }
+            for s in snippets
+        ]
+        operations = _campaign_asset_mutate_operations(formatted_customer_id, campaign_id, assets, "STRUCTURED_SNIPPET")
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"mutateOperations": operations})
 
-        if not link_response.ok:
-            raise Exception(f"Error linking snippets to campaign: {link_response.status_code} {link_response.reason} - {link_response.text}")
+        if not response.ok:
+            raise Exception(f"Error adding structured snippets: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        link_rns = [r.get('resourceName', '') for r in link_response.json().get('results', [])]
+        asset_rns, link_rns = _campaign_asset_results(_json_loads(response))
 
         if ctx:
-            ctx.info(f"Successfully added {len(link_rns)} structured snippet(s).")
+            await ctx.info(f"Successfully added {len(link_rns)} structured snippet(s).")
 
         return {
             "snippets_added": len(link_rns),
@@ -1898,12 +2030,12 @@ def add_structured_snippets(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_call_asset(
+async def add_call_asset(
     customer_id: str,
     campaign_id: str,
     phone_number: str,
@@ -1927,57 +2059,35 @@ def add_call_asset(
         raise ValueError("phone_number must not be empty.")
 
     if ctx:
-        ctx.info(f"Adding call asset ({phone_number}) to campaign {campaign_id}...")
+        await ctx.info(f"Adding call asset ({phone_number}) to campaign {campaign_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
-        asset_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/assets:mutate"
-        asset_response = _make_request(requests.post, asset_url, headers, json_body={
-            "operations": [{
-                "create": {
-                    "name": f"Call: {phone_number}",
-                    "callAsset": {
-                        "phoneNumber": phone_number,
-                        "countryCode": country_code.upper()
-                    }
-                }
-            }]
-        })
-
-        if not asset_response.ok:
-            raise Exception(f"Error creating call asset: {asset_response.status_code} {asset_response.reason} - {asset_response.text}")
-
-        asset_rn = asset_response.json().get('results', [{}])[0].get('resourceName', '')
-
-        if ctx:
-            ctx.info(f"Call asset created. Linking to campaign...")
-
-        link_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignAssets:mutate"
-        link_response = _make_request(requests.post, link_url, headers, json_body={
-            "operations": [{
-                "create": {
-                    "asset": asset_rn,
-                    "campaign": f"customers/{formatted_customer_id}/campaigns/{campaign_id.strip()}",
-                    "fieldType": "CALL"
-                }
-            }]
-        })
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:mutate"
+        asset = {
+            "name": f"Call: {phone_number}",
+            "callAsset": {
+                "phoneNumber": phone_number,
+                "countryCode": country_code.upper()
+            }
+        }
+        operations = _campaign_asset_mutate_operations(formatted_customer_id, campaign_id, [asset], "CALL")
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"mutateOperations": operations})
 
-        if not link_response.ok:
-            raise Exception(f"Error linking call asset to campaign: {link_response.status_code} {link_response.reason} - {link_response.text}")
+        if not response.ok:
+            raise Exception(f"Error adding call asset: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        link_rn = link_response.json().get('results', [{}])[0].get('resourceName', '')
+        asset_rns, link_rns = _campaign_asset_results(_json_loads(response))
+        asset_rn = asset_rns[0] if asset_rns else ''
+        link_rn = link_rns[0] if link_rns else ''
 
         if ctx:
-            ctx.info(f"Call asset linked: {link_rn}")
+            await ctx.info(f"Call asset linked: {link_rn}")
 
         return {
             "call_asset_added": True,
@@ -1991,12 +2101,12 @@ def add_call_asset(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def add_audience_targeting(
+async def add_audience_targeting(
     customer_id: str,
     user_list_id: str,
     campaign_id: str = "",
@@ -2031,18 +2141,15 @@ def add_audience_targeting(
 
     level = "campaign" if campaign_id else "ad group"
     if ctx:
-        ctx.info(f"Adding user list {user_list_id} to {level} for customer {customer_id}...")
+        await ctx.info(f"Adding user list {user_list_id} to {level} for customer {customer_id}...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
         user_list_rn = f"customers/{formatted_customer_id}/userLists/{user_list_id.strip()}"
 
         if campaign_id:
@@ -2061,15 +2168,15 @@ def add_audience_targeting(
         if bid_modifier != 1.0:
             criterion['bidModifier'] = bid_modifier
 
-        response = _make_request(requests.post, url, headers, json_body={"operations": [{"create": criterion}]})
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"operations": [{"create": criterion}]})
 
         if not response.ok:
-            raise Exception(f"Error adding audience: {response.status_code} {response.reason} - {response.text}")
+            raise Exception(f"Error adding audience: {response.status_code} {response.reason} - {_error_body(response)}")
 
-        resource_name = response.json().get('results', [{}])[0].get('resourceName', '')
+        resource_name = _json_loads(response).get('results', [{}])[0].get('resourceName', '')
 
         if ctx:
-            ctx.info(f"Audience targeting added: {resource_name}")
+            await ctx.info(f"Audience targeting added: {resource_name}")
 
         return {
             "audience_added": resource_name,
@@ -2083,12 +2190,12 @@ def add_audience_targeting(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 
 @mcp.tool
-def create_shared_negative_list(
+async def create_shared_negative_list(
     customer_id: str,
     list_name: str,
     keywords: List[Dict[str, str]],
@@ -2113,82 +2220,65 @@ def create_shared_negative_list(
     if not keywords:
         raise ValueError("keywords list must not be empty.")
 
-    valid_match_types = {'BROAD', 'PHRASE', 'EXACT'}
+    match_types = []
     for kw in keywords:
         if 'text' not in kw or 'match_type' not in kw:
             raise ValueError("Each keyword must have 'text' and 'match_type'.")
-        if kw['match_type'].upper() not in valid_match_types:
+        match_type = kw['match_type'].upper()
+        if match_type not in VALID_MATCH_TYPES:
             raise ValueError(f"Invalid match_type '{kw['match_type']}'. Must be BROAD, PHRASE, or EXACT.")
+        match_types.append(match_type)
 
     if ctx:
-        ctx.info(f"Creating shared negative list '{list_name}' with {len(keywords)} keyword(s)...")
+        await ctx.info(f"Creating shared negative list '{list_name}' with {len(keywords)} keyword(s)...")
 
     if not GOOGLE_ADS_DEVELOPER_TOKEN:
         raise ValueError("Google Ads Developer Token is not set in environment variables.")
 
     try:
-        headers = get_headers_with_auto_token()
+        headers = await asyncio.to_thread(get_headers_with_auto_token, customer_id, manager_id)
         formatted_customer_id = format_customer_id(customer_id)
 
-        if manager_id:
-            headers['login-customer-id'] = format_customer_id(manager_id)
-
-        ss_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/sharedSets:mutate"
-        ss_response = _make_request(requests.post, ss_url, headers, json_body={
-            "operations": [{"create": {"name": list_name, "type": "NEGATIVE_KEYWORDS"}}]
-        })
-
-        if not ss_response.ok:
-            raise Exception(f"Error creating shared set: {ss_response.status_code} {ss_response.reason} - {ss_response.text}")
-
-        shared_set_rn = ss_response.json().get('results', [{}])[0].get('resourceName', '')
-
-        if ctx:
-            ctx.info(f"Shared set created: {shared_set_rn}. Adding keywords...")
-
-        ssc_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/sharedSetCriteria:mutate"
-        ssc_response = _make_request(requests.post, ssc_url, headers, json_body={
-            "operations": [
-                {
-                    "create": {
-                        "sharedSet": shared_set_rn,
-                        "keyword": {"text": kw['text'], "matchType": kw['match_type'].upper()}
-                    }
-                }
-                for kw in keywords
-            ]
-        })
-
-        if not ssc_response.ok:
-            raise Exception(f"Error adding keywords to shared set: {ssc_response.status_code} {ssc_response.reason} - {ssc_response.text}")
+        # The keywords and campaign links reference the new shared set by its
+        # temporary (negative) resource name, so everything goes out as one
+        # atomic request
+        shared_set_rn = f"customers/{formatted_customer_id}/sharedSets/-1"
+        campaign_prefix = f"customers/{formatted_customer_id}/campaigns/"
+        operations = [{"sharedSetOperation": {"create": {
+            "resourceName": shared_set_rn, "name": list_name, "type": "NEGATIVE_KEYWORDS"
+        }}}]
+        operations.extend(
+            {"sharedCriterionOperation": {"create": {
+                "sharedSet": shared_set_rn,
+                "keyword": {"text": kw['text'], "matchType": match_type}
+            }}}
+            for kw, match_type in zip(keywords, match_types)
+        )
+        operations.extend(
+            {"campaignSharedSetOperation": {"create": {
+                "campaign": campaign_prefix + cid.strip(),
+                "sharedSet": shared_set_rn
+            }}}
+            for cid in campaign_ids or []
+        )
 
-        keyword_rns = [r.get('resourceName', '') for r in ssc_response.json().get('results', [])]
+        url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/googleAds:mutate"
+        response = await asyncio.to_thread(_make_request, _session.post, url, headers, json_body={"mutateOperations": operations})
 
-        campaign_link_rns = []
-        if campaign_ids:
-            if ctx:
-                ctx.info(f"Linking shared set to {len(campaign_ids)} campaign(s)...")
-
-            css_url = f"https://googleads.googleapis.com/{API_VERSION}/customers/{formatted_customer_id}/campaignSharedSets:mutate"
-            css_response = _make_request(requests.post, css_url, headers, json_body={
-                "operations": [
-                    {
-                        "create": {
-                            "campaign": f"customers/{formatted_customer_id}/campaigns/{cid.strip()}",
-                            "sharedSet": shared_set_rn
-                        }
-                    }
-                    for cid in campaign_ids
-                ]
-            })
-
-            if not css_response.ok:
-                raise Exception(f"Error linking shared set to campaigns: {css_response.status_code} {css_response.reason} - {css_response.text}")
+        if not response.ok:
+            raise Exception(f"Error creating shared negative list: {response.status_code} {response.reason} - {_error_body(response)}")
 
-            campaign_link_rns = [r.get('resourceName', '') for r in css_response.json().get('results', [])]
+        keyword_rns, campaign_link_rns = [], []
+        for r in _json_loads(response).get('mutateOperationResponses', []):
+            if 'sharedSetResult' in r:
+                shared_set_rn = r['sharedSetResult'].get('resourceName', '')
+            elif 'sharedCriterionResult' in r:
+                keyword_rns.append(r['sharedCriterionResult'].get('resourceName', ''))
+            elif 'campaignSharedSetResult' in r:
+                campaign_link_rns.append(r['campaignSharedSetResult'].get('resourceName', ''))
 
         if ctx:
-            ctx.info(f"Shared negative list created with {len(keyword_rns)} keyword(s) and linked to {len(campaign_link_rns)} campaign(s).")
+            await ctx.info(f"Shared negative list created with {len(keyword_rns)} keyword(s) and linked to {len(campaign_link_rns)} campaign(s).")
 
         return {
             "shared_set_created": shared_set_rn,
@@ -2202,7 +2292,7 @@ def create_shared_negative_list(
 
     except Exception as e:
         if ctx:
-            ctx.error(f"An unexpected error occurred: {e}")
+            await ctx.error(f"An unexpected error occurred: {e}")
         raise
 
 